@@ -1,59 +1,272 @@
 """CalDAV tools for calendar management."""
 
-import caldav
-import smtplib
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+import asyncio
+import hashlib
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from functools import partial
+from datetime import date, datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Callable, List, Dict, Any, Optional, Tuple
 from urllib.parse import urlparse
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
 from mcp.server.fastmcp import Context
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from .auth import require_auth
 from .config import config
 
-
-def _get_caldav_client(email: str, password: str) -> caldav.DAVClient:
-    """Create CalDAV client (stateless)."""
-    return caldav.DAVClient(
-        url=config.CALDAV_SERVER,
-        username=email,
-        password=password
+if TYPE_CHECKING:
+    import smtplib
+
+    import caldav
+
+# caldav (with lxml and icalendar) is imported inside the functions that use it,
+# so server start-up and non-calendar tools don't pay for it. The same goes for
+# the SMTP/MIME stack, which only invitations need.
+
+# Config is read from the environment once at import, so bind it once here too
+_CALDAV_URL = config.CALDAV_SERVER
+
+# Cached CalDAV clients keyed by (email, sha256(password)). Reusing a client
+# keeps its requests.Session alive, so successive tool calls share pooled
+# keep-alive HTTPS connections instead of paying a TCP+TLS handshake each time.
+# caldav memoizes client.principal(), so principal discovery (a PROPFIND) is
+# also paid only once per cached client.
+_CLIENT_CACHE_SIZE = 16
+_CLIENT_CACHE: "OrderedDict[Tuple[str, str], caldav.DAVClient]" = OrderedDict()
+_CLIENT_LOCK = threading.Lock()
+
+# iCloud (and NAT gateways in front of hosted deployments) silently drop
+# keep-alive connections after a few idle minutes; a request on such a socket
+# hangs until the read timeout. Pools idle for longer than this are emptied
+# before reuse so the next request opens a fresh connection instead.
+_CLIENT_IDLE_TIMEOUT = 300.0
+_CLIENT_LAST_USED: Dict[Tuple[str, str], float] = {}
+
+# Upper bound on concurrent per-calendar REPORTs; matches the session pool size
+# so parallel searches never queue on (or overflow) the connection pool.
+_MAX_CONCURRENT_SEARCHES = 8
+
+# Calendar collections per cached client: (fetched_at, all, event calendars).
+# principal.calendars() is a PROPFIND, and the collection list rarely changes.
+_CALENDARS_TTL = 60.0
+_CALENDARS_CACHE: "Dict[caldav.DAVClient, Tuple[float, List[caldav.Calendar], List[caldav.Calendar]]]" = {}
+
+# list_events results per (client, calendar_id, start_date, end_date):
+# (fetched_at, generation, events). Any event write bumps the generation,
+# so repeated reads of the same window are served locally until then.
+_EVENTS_TTL = 30.0
+_EVENTS_CACHE: Dict[Tuple[Any, ...], Tuple[float, int, List[Dict[str, Any]]]] = {}
+_EVENTS_GENERATION = 0
+
+# Per-calendar list_events results validated by the collection's DAV
+# sync-token (RFC 6578), keyed by (client, calendar URL, window):
+# (sync_token, events). The token changes whenever anything in the
+# collection does, so a matching token means the cached events are current
+# and the full calendar-query REPORT can be skipped for a small PROPFIND.
+_SYNC_CACHE_SIZE = 256
+_SYNC_CACHE: Dict[Tuple[Any, ...], Tuple[str, List[Dict[str, Any]]]] = {}
+_SYNC_LOCK = threading.Lock()
+
+# list_events splits only windows longer than _SEARCH_SPLIT_OVER (well past
+# the default -90/+365 days, which stays one REPORT) into slices of
+# _SEARCH_SLICE, so no single REPORT has to return years of expanded events
+_SEARCH_SPLIT_OVER = timedelta(days=730)
+_SEARCH_SLICE = timedelta(days=365)
+
+# Reminder/task collections show up in principal.calendars() but hold no VEVENTs
+_REMINDER_RE = re.compile(r'⚠|reminder', re.IGNORECASE)
+
+# Line folding (RFC 5545 §3.1): a line break followed by a space or tab
+_FOLDED_LINE_RE = re.compile(r'\r?\n[ \t]')
+
+# iCalendar properties matched by search_events
+_SEARCH_FIELDS = ("SUMMARY", "DESCRIPTION", "LOCATION")
+
+# Local date-time form used for DTSTART/DTEND (DTSTAMP appends "Z")
+_ICAL_DT_FMT = '%Y%m%dT%H%M%S'
+
+# RFC 5545 TEXT escaping, applied in a single pass with str.translate
+_ICAL_ESCAPE = str.maketrans({'\\': '\\\\', ',': '\\,', ';': '\\;', '\n': '\\n'})
+
+
+def _mount_pooled_adapter(client: "caldav.DAVClient") -> None:
+    """Install a pooled, retrying HTTPS adapter on the client's session."""
+    retry = Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(
+            {"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "PROPFIND", "REPORT"}
+        ),
+    )
+    # HTTP/1.1 keep-alive pool sized to the search fan-out. pool_block makes
+    # extra threads wait for a pooled connection instead of opening (and then
+    # discarding) throwaway ones, so handshakes stay bounded by pool_maxsize.
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=_MAX_CONCURRENT_SEARCHES,
+        pool_block=True,
+        max_retries=retry,
     )
+    client.session.mount("https://", adapter)
+
+
+def _get_caldav_client(email: str, password: str) -> "caldav.DAVClient":
+    """Return a cached CalDAV client for these credentials (LRU-bounded)."""
+    import caldav
+
+    key = (email, hashlib.sha256(password.encode()).hexdigest())
+    now = time.monotonic()
+    with _CLIENT_LOCK:
+        client = _CLIENT_CACHE.get(key)
+        if client is not None:
+            _CLIENT_CACHE.move_to_end(key)
+            if now - _CLIENT_LAST_USED.get(key, now) > _CLIENT_IDLE_TIMEOUT:
+                # Closes pooled connections only; the adapters stay mounted
+                client.session.close()
+            _CLIENT_LAST_USED[key] = now
+            return client
+
+        client = caldav.DAVClient(
+            url=_CALDAV_URL,
+            username=email,
+            password=password
+        )
+        _mount_pooled_adapter(client)
+        _CLIENT_CACHE[key] = client
+        _CLIENT_LAST_USED[key] = now
+        if len(_CLIENT_CACHE) > _CLIENT_CACHE_SIZE:
+            evicted_key, evicted = _CLIENT_CACHE.popitem(last=False)
+            _CLIENT_LAST_USED.pop(evicted_key, None)
+            _CALENDARS_CACHE.pop(evicted, None)
+            for cache_key in [k for k in _EVENTS_CACHE if k[0] is evicted]:
+                del _EVENTS_CACHE[cache_key]
+            with _SYNC_LOCK:
+                for cache_key in [k for k in _SYNC_CACHE if k[0] is evicted]:
+                    del _SYNC_CACHE[cache_key]
+            evicted.close()
+        return client
+
+
+def _account_client() -> Tuple[str, str, "caldav.DAVClient"]:
+    """Authenticate the request and return (email, password, cached client).
+
+    Every CalDAV tool starts here, so the cached client is the only path.
+    """
+    email, password = require_auth()
+    return email, password, _get_caldav_client(email, password)
+
+
+def _is_event_calendar(cal: "caldav.Calendar") -> bool:
+    """True for named calendars that are not reminder/task lists."""
+    return bool(cal.name) and not _REMINDER_RE.search(cal.name)
+
+
+def _cached_calendars(
+    client: "caldav.DAVClient"
+) -> Tuple[List["caldav.Calendar"], List["caldav.Calendar"]]:
+    """Return (all calendars, event calendars) for a client, cached briefly."""
+    now = time.monotonic()
+    cached = _CALENDARS_CACHE.get(client)
+    if cached is not None and now - cached[0] < _CALENDARS_TTL:
+        return cached[1], cached[2]
+
+    all_calendars = client.principal().calendars()
+    event_calendars = [cal for cal in all_calendars if _is_event_calendar(cal)]
+    _CALENDARS_CACHE[client] = (now, all_calendars, event_calendars)
+    return all_calendars, event_calendars
+
+
+def _invalidate_calendars_on_error(client: "caldav.DAVClient", results: List[Any]) -> None:
+    """Drop the cached calendar list if any request hit a 401/403/404."""
+    from caldav.lib import error as caldav_error
+
+    if any(
+        isinstance(r, (caldav_error.NotFoundError, caldav_error.AuthorizationError))
+        for r in results
+    ):
+        _CALENDARS_CACHE.pop(client, None)
+
+
+def _invalidate_events() -> None:
+    """Expire every cached list_events result after an event write."""
+    global _EVENTS_GENERATION
+    _EVENTS_GENERATION += 1
+    _EVENTS_CACHE.clear()
+
+
+def _fold(line: str) -> str:
+    """Fold an iCalendar content line at 75 octets (RFC 5545 section 3.1)."""
+    if len(line.encode('utf-8')) <= 75:
+        return line
+
+    parts = []
+    current = []
+    size = 0
+    limit = 75
+    for char in line:
+        char_size = len(char.encode('utf-8'))
+        if size + char_size > limit:
+            parts.append(''.join(current))
+            current = []
+            size = 0
+            # Continuation lines start with a space, which counts toward 75
+            limit = 74
+        current.append(char)
+        size += char_size
+    parts.append(''.join(current))
+    return '\r\n '.join(parts)
 
 
 def _send_calendar_invitation(
     organizer_email: str,
     organizer_password: str,
-    attendee_email: str,
+    attendee_emails: List[str],
     ical_data: str,
     summary: str,
     start: str,
     end: str,
     location: Optional[str] = None,
-    method: str = "REQUEST"
-) -> None:
+    method: str = "REQUEST",
+    smtp_client: Optional["smtplib.SMTP"] = None
+) -> Dict[str, Any]:
     """
     Send calendar invitation via email (iTIP protocol).
 
+    All attendees receive the same message in a single SMTP transaction; the
+    ATTENDEE lines in the iCalendar body already identify each of them.
+
     Args:
         organizer_email: Organizer's email address
         organizer_password: Organizer's password
-        attendee_email: Attendee's email address
+        attendee_emails: Attendee email addresses
         ical_data: iCalendar data (VCALENDAR format)
         summary: Event summary
         start: Start datetime string
         end: End datetime string
         location: Event location (optional)
         method: iTIP method (REQUEST, CANCEL, etc.)
+        smtp_client: Logged-in SMTP session to send through (optional; a
+            one-off session is opened and closed when omitted)
+
+    Returns:
+        Recipients the server refused, as returned by smtplib
     """
+    import smtplib
+    from email.mime.multipart import MIMEMultipart
+    from email.mime.text import MIMEText
+    from email.utils import formatdate
+
     # Create multipart message
     msg = MIMEMultipart('alternative')
     msg['From'] = organizer_email
-    msg['To'] = attendee_email
+    msg['To'] = ', '.join(attendee_emails)
     msg['Subject'] = f"Invitation: {summary}"
 
     # Add Date header
-    from email.utils import formatdate
     msg['Date'] = formatdate(localtime=True)
 
     # Create plain text part
@@ -70,25 +283,22 @@ End: {end}"""
 
     msg.attach(MIMEText(text_body, 'plain'))
 
-    # Modify iCalendar data to include METHOD
-    # Replace the first line with VCALENDAR and METHOD
-    ical_lines = ical_data.strip().split('\n')
-    if ical_lines[0] == 'BEGIN:VCALENDAR':
-        # Insert METHOD after BEGIN:VCALENDAR
-        ical_lines.insert(1, f'METHOD:{method}')
-        ical_with_method = '\n'.join(ical_lines)
-    else:
-        ical_with_method = ical_data
-
-    # Add organizer to the VEVENT if not present
-    if 'ORGANIZER' not in ical_with_method:
-        # Insert ORGANIZER after UID
-        ical_lines = ical_with_method.split('\n')
-        for i, line in enumerate(ical_lines):
-            if line.startswith('UID:'):
-                ical_lines.insert(i + 1, f'ORGANIZER;CN={organizer_email}:mailto:{organizer_email}')
-                break
-        ical_with_method = '\n'.join(ical_lines)
+    # Insert METHOD after BEGIN:VCALENDAR and, when absent, ORGANIZER after UID
+    # in a single pass (splitlines handles both the CRLF data we build and
+    # vobject's output)
+    ical_lines = ical_data.strip().splitlines()
+    need_method = bool(ical_lines) and ical_lines[0] == 'BEGIN:VCALENDAR'
+    need_organizer = 'ORGANIZER' not in ical_data
+    out_lines = []
+    for line in ical_lines:
+        out_lines.append(line)
+        if need_method and line == 'BEGIN:VCALENDAR':
+            out_lines.append(f'METHOD:{method}')
+            need_method = False
+        elif need_organizer and line.startswith('UID:'):
+            out_lines.append(f'ORGANIZER;CN={organizer_email}:mailto:{organizer_email}')
+            need_organizer = False
+    ical_with_method = '\r\n'.join(out_lines)
 
     # Create calendar part with proper content type
     cal_part = MIMEText(ical_with_method, 'calendar', 'utf-8')
@@ -96,14 +306,20 @@ End: {end}"""
     cal_part.add_header('Content-Type', f'text/calendar; method={method}; charset=UTF-8')
     msg.attach(cal_part)
 
+    # Serialize the MIME tree once; the same bytes go to SMTP and the Sent folder
+    msg_bytes = msg.as_bytes()
+
     # Send via SMTP
-    smtp_client = smtplib.SMTP(config.SMTP_SERVER, config.SMTP_PORT)
-    try:
-        smtp_client.starttls()
-        smtp_client.login(organizer_email, organizer_password)
-        smtp_client.send_message(msg, from_addr=organizer_email, to_addrs=[attendee_email])
-    finally:
-        smtp_client.quit()
+    if smtp_client is not None:
+        refused = smtp_client.sendmail(organizer_email, attendee_emails, msg_bytes)
+    else:
+        smtp_client = smtplib.SMTP(config.SMTP_SERVER, config.SMTP_PORT)
+        try:
+            smtp_client.starttls()
+            smtp_client.login(organizer_email, organizer_password)
+            refused = smtp_client.sendmail(organizer_email, attendee_emails, msg_bytes)
+        finally:
+            smtp_client.quit()
 
     # Save copy to Sent folder via IMAP (same as regular emails)
     try:
@@ -111,9 +327,6 @@ End: {end}"""
 
         imap_client = _get_imap_client(organizer_email, organizer_password)
         try:
-            # Convert message to bytes
-            msg_bytes = msg.as_bytes()
-
             # Try to append to Sent folder
             try:
                 imap_client.append(config.SENT_FOLDER, msg_bytes, flags=['\\Seen'])
@@ -131,6 +344,55 @@ End: {end}"""
         # Silently ignore errors saving to Sent folder
         pass
 
+    return refused
+
+
+def _send_invitations(
+    organizer_email: str,
+    organizer_password: str,
+    attendee_emails: List[str],
+    ical_data: str,
+    summary: str,
+    start: str,
+    end: str,
+    location: Optional[str] = None,
+    method: str = "REQUEST"
+) -> None:
+    """
+    Send one invitation message to all attendees.
+
+    Failures are logged, never raised: the calendar change has already been
+    saved by the time invitations go out.
+    """
+    import logging
+    from .email import _close_smtp_client, _get_smtp_client
+
+    try:
+        smtp_client = _get_smtp_client(organizer_email, organizer_password)
+    except Exception as e:
+        logging.error(f"Failed to connect to SMTP for {method} invitations: {e}")
+        return
+
+    try:
+        refused = _send_calendar_invitation(
+            organizer_email=organizer_email,
+            organizer_password=organizer_password,
+            attendee_emails=attendee_emails,
+            ical_data=ical_data,
+            summary=summary,
+            start=start,
+            end=end,
+            location=location,
+            method=method,
+            smtp_client=smtp_client
+        )
+        for attendee_email, reply in refused.items():
+            logging.error(f"Failed to send {method} invitation to {attendee_email}: {reply}")
+    except Exception as e:
+        logging.error(f"Failed to send {method} invitation to {', '.join(attendee_emails)}: {e}")
+    finally:
+        _close_smtp_client(smtp_client)
+
 
 async def list_calendars(context: Context) -> List[Dict[str, Any]]:
     """
@@ -139,10 +401,8 @@ async def list_calendars(context: Context) -> List[Dict[str, Any]]:
     Returns:
         List of calendars with id, name, and description
     """
-    email, password = require_auth()
-    client = _get_caldav_client(email, password)
-    principal = client.principal()
-    calendars = principal.calendars()
+    _, _, client = _account_client()
+    calendars, _ = _cached_calendars(client)
 
     result = []
     for cal in calendars:
@@ -155,28 +415,11 @@ async def list_calendars(context: Context) -> List[Dict[str, Any]]:
     return result
 
 
-async def list_events(
-    context: Context,
-    calendar_id: Optional[str] = None,
-    start_date: Optional[str] = None,
-    end_date: Optional[str] = None
-) -> List[Dict[str, Any]]:
-    """
-    List calendar events with optional filtering.
-
-    Args:
-        calendar_id: Specific calendar URL/ID (optional, defaults to all non-reminder calendars)
-        start_date: Start date filter in ISO format (YYYY-MM-DD)
-        end_date: End date filter in ISO format (YYYY-MM-DD)
-
-    Returns:
-        List of events with details
-    """
-    email, password = require_auth()
-    client = _get_caldav_client(email, password)
-    principal = client.principal()
-
-    # Parse dates
+def _parse_date_range(
+    start_date: Optional[str],
+    end_date: Optional[str]
+) -> Tuple[datetime, datetime]:
+    """Resolve optional ISO start/end filters into a concrete search window."""
     if start_date:
         start = datetime.fromisoformat(start_date)
         # If only date provided (no time), set to start of day
@@ -194,81 +437,371 @@ async def list_events(
     else:
         end = datetime.now() + timedelta(days=365)
 
-    result = []
+    return start, end
+
 
-    # Get calendars
+def _calendars_to_search(
+    client: "caldav.DAVClient",
+    calendar_id: Optional[str]
+) -> List["caldav.Calendar"]:
+    """Return the requested calendar, or all non-reminder calendars."""
     if calendar_id:
-        calendars_to_search = [caldav.Calendar(client=client, url=calendar_id)]
-    else:
-        all_calendars = principal.calendars()
-        if not all_calendars:
-            return []
-
-        # Filter out reminder calendars (they don't have events in the same format)
-        calendars_to_search = [
-            cal for cal in all_calendars
-            if cal.name and '⚠' not in cal.name and 'reminder' not in cal.name.lower()
-        ]
+        import caldav
+
+        return [caldav.Calendar(client=client, url=calendar_id)]
+
+    all_calendars, event_calendars = _cached_calendars(client)
+
+    # If all calendars are filtered out, search all
+    return event_calendars or all_calendars
+
+
+async def _gather_bounded(calls: List[Callable[[], Any]]) -> List[Any]:
+    """Run blocking CalDAV calls concurrently in worker threads.
+
+    Concurrency is capped to the session pool size. Exceptions are returned in
+    place of results so callers can skip failing calendars.
+    """
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_SEARCHES)
+
+    async def _run(call: Callable[[], Any]) -> Any:
+        async with semaphore:
+            return await asyncio.to_thread(call)
+
+    return await asyncio.gather(*[_run(call) for call in calls], return_exceptions=True)
+
+
+def _iso_value(prop: Any) -> Optional[str]:
+    """Best-effort ISO string for a vobject DTSTART/DTEND property."""
+    if not prop:
+        return None
+    try:
+        value = prop.value
+    except Exception as _e:
+        return None
+    return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+
+
+def _ical_iso(prop: Any) -> Optional[str]:
+    """Best-effort ISO string for an icalendar DTSTART/DTEND property."""
+    if prop is None:
+        return None
+    value = getattr(prop, 'dt', prop)
+    return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+
+
+def _event_fields(
+    event: "caldav.CalendarObjectResource"
+) -> Tuple[str, str, str, Optional[str], Optional[str]]:
+    """Return (summary, description, location, start, end) for an event."""
+    # caldav's search already parsed each result with icalendar (it checks
+    # for recurrences to expand), so reading that component costs no extra
+    # parse; going through vobject_instance would parse the data a second time.
+    try:
+        component = event.icalendar_component
+    except Exception as _e:
+        component = None
+
+    if component is not None and component.name == "VEVENT":
+        get = component.get
+        return (
+            str(get('SUMMARY', "")),
+            str(get('DESCRIPTION', "")),
+            str(get('LOCATION', "")),
+            _ical_iso(get('DTSTART')),
+            _ical_iso(get('DTEND')),
+        )
+
+    # Fallback: vobject, which copes with some data icalendar rejects.
+    # date_search already returns calendar data with each result;
+    # only fall back to a GET when the server omitted it.
+    try:
+        vevent = event.vobject_instance.vevent
+    except AttributeError:
+        event.load()
+        vevent = event.vobject_instance.vevent
+
+    # Look each property up once; every hasattr/attribute access on a vobject
+    # component walks its children.
+    summary = getattr(vevent, 'summary', None)
+    description = getattr(vevent, 'description', None)
+    location = getattr(vevent, 'location', None)
+    return (
+        str(summary.value) if summary else "",
+        str(description.value) if description else "",
+        str(location.value) if location else "",
+        _iso_value(getattr(vevent, 'dtstart', None)),
+        _iso_value(getattr(vevent, 'dtend', None)),
+    )
+
+
+def _event_to_dict(event: "caldav.CalendarObjectResource", calendar_name: str) -> Dict[str, Any]:
+    """Convert a searched event into the tool's result dict."""
+    summary, description, location, start, end = _event_fields(event)
+    url = str(event.url)
+
+    return {
+        "id": url,
+        "summary": summary,
+        "description": description,
+        "start": start,
+        "end": end,
+        "location": location,
+        "calendar": calendar_name,
+        "url": url
+    }
 
-        # If all calendars are filtered out, search all
-        if not calendars_to_search:
-            calendars_to_search = all_calendars
 
-    # Search events in all relevant calendars
-    for calendar in calendars_to_search:
+def _events_to_dicts(calendar: "caldav.Calendar", events: List[Any]) -> List[Dict[str, Any]]:
+    """Convert one calendar's search results, skipping malformed events."""
+    result = []
+    calendar_name = calendar.name or "Unknown"
+    for event in events:
         try:
-            # Fetch events using date_search
-            events = calendar.date_search(start=start, end=end, expand=True)
-
-            for event in events:
-                try:
-                    event.load()  # Ensure event data is loaded
-                    vevent = event.vobject_instance.vevent
-
-                    # Parse start/end dates safely
-                    start_value = None
-                    end_value = None
-
-                    if hasattr(vevent, 'dtstart') and vevent.dtstart:
-                        try:
-                            start_value = vevent.dtstart.value
-                            if hasattr(start_value, 'isoformat'):
-                                start_value = start_value.isoformat()
-                            else:
-                                start_value = str(start_value)
-                        except Exception as _e:
-                            pass
-
-                    if hasattr(vevent, 'dtend') and vevent.dtend:
-                        try:
-                            end_value = vevent.dtend.value
-                            if hasattr(end_value, 'isoformat'):
-                                end_value = end_value.isoformat()
-                            else:
-                                end_value = str(end_value)
-                        except Exception as _e:
-                            pass
-
-                    result.append({
-                        "id": str(event.url),
-                        "summary": str(vevent.summary.value) if hasattr(vevent, 'summary') and vevent.summary else "",
-                        "description": str(vevent.description.value) if hasattr(vevent, 'description') and vevent.description else "",
-                        "start": start_value,
-                        "end": end_value,
-                        "location": str(vevent.location.value) if hasattr(vevent, 'location') and vevent.location else "",
-                        "calendar": calendar.name or "Unknown",
-                        "url": str(event.url)
-                    })
-                except Exception as _e:
-                    # Skip malformed events
-                    continue
+            result.append(_event_to_dict(event, calendar_name))
         except Exception as _e:
+            # Skip malformed events
+            continue
+
+    return result
+
+
+def _collect_events(
+    calendars: List["caldav.Calendar"],
+    searches: List[Any]
+) -> List[Dict[str, Any]]:
+    """Flatten per-calendar search results into event dicts."""
+    result = []
+    for calendar, events in zip(calendars, searches):
+        if isinstance(events, Exception):
             # Skip calendars that fail to search
             continue
+        result.extend(_events_to_dicts(calendar, events))
 
     return result
 
 
+def _sync_token(calendar: "caldav.Calendar") -> Optional[str]:
+    """Current DAV:sync-token of a calendar, or None if it has none."""
+    from caldav.elements import dav
+
+    try:
+        return calendar.get_property(dav.SyncToken())
+    except Exception as _e:
+        return None
+
+
+def _cached_calendar_events(
+    calendar: "caldav.Calendar",
+    token: Optional[str],
+    window: Tuple[Any, ...]
+) -> Optional[List[Dict[str, Any]]]:
+    """Return the stored events for a calendar if its sync-token still matches."""
+    if token is None:
+        return None
+    with _SYNC_LOCK:
+        cached = _SYNC_CACHE.get((calendar.client, str(calendar.url), window))
+    if cached is not None and cached[0] == token:
+        return cached[1]
+    return None
+
+
+def _store_calendar_events(
+    calendar: "caldav.Calendar",
+    token: Optional[str],
+    window: Tuple[Any, ...],
+    events: List[Dict[str, Any]]
+) -> None:
+    """Remember a calendar's events under the sync-token they were fetched at."""
+    if token is None:
+        return
+    key = (calendar.client, str(calendar.url), window)
+    with _SYNC_LOCK:
+        _SYNC_CACHE.pop(key, None)
+        _SYNC_CACHE[key] = (token, events)
+        if len(_SYNC_CACHE) > _SYNC_CACHE_SIZE:
+            del _SYNC_CACHE[next(iter(_SYNC_CACHE))]
+
+
+def _date_slices(start: datetime, end: datetime) -> List[Tuple[datetime, datetime]]:
+    """Split a search window longer than _SEARCH_SPLIT_OVER into slices of at most _SEARCH_SLICE."""
+    if end - start <= _SEARCH_SPLIT_OVER:
+        return [(start, end)]
+    slices = []
+    while start < end:
+        slice_end = min(start + _SEARCH_SLICE, end)
+        slices.append((start, slice_end))
+        start = slice_end
+    return slices or [(start, end)]
+
+
+async def list_events(
+    context: Context,
+    calendar_id: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    List calendar events with optional filtering.
+
+    Args:
+        calendar_id: Specific calendar URL/ID (optional, defaults to all non-reminder calendars)
+        start_date: Start date filter in ISO format (YYYY-MM-DD)
+        end_date: End date filter in ISO format (YYYY-MM-DD)
+
+    Returns:
+        List of events with details
+    """
+    _, _, client = _account_client()
+
+    cache_key = (client, calendar_id, start_date, end_date)
+    cached = _EVENTS_CACHE.get(cache_key)
+    if (
+        cached is not None
+        and cached[1] == _EVENTS_GENERATION
+        and time.monotonic() - cached[0] < _EVENTS_TTL
+    ):
+        return list(cached[2])
+
+    generation = _EVENTS_GENERATION
+    start, end = _parse_date_range(start_date, end_date)
+    calendars_to_search = _calendars_to_search(client, calendar_id)
+
+    # Relative default windows move with the clock; keying them by day keeps
+    # a sync-validated result from outliving the range it was fetched for
+    window = (start_date, end_date, None if start_date and end_date else date.today())
+
+    # Calendars whose sync-token is unchanged are answered from the cache
+    tokens = [
+        token if isinstance(token, str) else None
+        for token in await _gather_bounded([partial(_sync_token, cal) for cal in calendars_to_search])
+    ]
+    per_calendar: List[Any] = [
+        _cached_calendar_events(cal, token, window)
+        for cal, token in zip(calendars_to_search, tokens)
+    ]
+
+    # The rest are searched in date slices, all slices of all calendars
+    # concurrently over the shared pooled session
+    slices = _date_slices(start, end)
+    jobs = [
+        (index, partial(calendars_to_search[index].date_search, start=slice_start, end=slice_end, expand=True))
+        for index, events in enumerate(per_calendar)
+        if events is None
+        for slice_start, slice_end in slices
+    ]
+    searches = await _gather_bounded([call for _, call in jobs])
+    _invalidate_calendars_on_error(client, searches)
+
+    found: Dict[int, List[Any]] = {index: [] for index, _ in jobs}
+    for (index, _), events in zip(jobs, searches):
+        if isinstance(events, Exception):
+            # A calendar with any failed slice is skipped as a whole
+            per_calendar[index] = events
+        else:
+            found[index].extend(events)
+
+    for index, events in found.items():
+        if isinstance(per_calendar[index], Exception):
+            continue
+        # An event overlapping a slice boundary is returned by both slices
+        seen = set()
+        unique = []
+        for event in events:
+            url = str(event.url)
+            if url not in seen:
+                seen.add(url)
+                unique.append(event)
+        calendar = calendars_to_search[index]
+        per_calendar[index] = _events_to_dicts(calendar, unique)
+        _store_calendar_events(calendar, tokens[index], window, per_calendar[index])
+
+    result = [
+        event
+        for events in per_calendar
+        if events is not None and not isinstance(events, Exception)
+        for event in events
+    ]
+
+    # Only cache complete answers from a generation no write has superseded
+    if generation == _EVENTS_GENERATION and not any(isinstance(r, Exception) for r in searches):
+        now = time.monotonic()
+        for stale in [k for k, v in _EVENTS_CACHE.items() if now - v[0] >= _EVENTS_TTL]:
+            del _EVENTS_CACHE[stale]
+        _EVENTS_CACHE[cache_key] = (now, generation, result)
+        result = list(result)
+
+    return result
+
+
+def _target_calendar(client: "caldav.DAVClient", calendar_id: Optional[str]) -> "caldav.Calendar":
+    """Return the calendar to create events in (default: first event calendar)."""
+    if calendar_id:
+        import caldav
+
+        return caldav.Calendar(client=client, url=calendar_id)
+
+    all_calendars, event_calendars = _cached_calendars(client)
+    if not all_calendars:
+        raise ValueError("No calendars found")
+
+    if not event_calendars:
+        raise ValueError("No event calendars found (only reminder/task calendars available)")
+
+    return event_calendars[0]
+
+
+def _build_event_ical(
+    summary: str,
+    start: str,
+    end: str,
+    description: Optional[str] = None,
+    location: Optional[str] = None,
+    attendees: Optional[List[str]] = None
+) -> str:
+    """Build the VCALENDAR payload for a new event."""
+    start_dt = datetime.fromisoformat(start)
+    end_dt = datetime.fromisoformat(end)
+    # DTSTAMP must be UTC (the "Z" form)
+    now = datetime.now(timezone.utc)
+
+    # Random UID, unique even for concurrent creates (hex: no dots, iCloud compatible)
+    uid = f"{uuid.uuid4().hex}@icloud-mcp"
+
+    # Build proper iCalendar format (iCloud is very strict about formatting):
+    # CRLF line endings, long lines folded at 75 octets
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//iCloud MCP//EN",
+        "CALSCALE:GREGORIAN",
+        "BEGIN:VEVENT",
+        f"UID:{uid}",
+        f"DTSTAMP:{now.strftime(_ICAL_DT_FMT)}Z",
+        f"DTSTART:{start_dt.strftime(_ICAL_DT_FMT)}",
+        f"DTEND:{end_dt.strftime(_ICAL_DT_FMT)}",
+        f"SUMMARY:{summary.translate(_ICAL_ESCAPE)}",
+        "STATUS:CONFIRMED",
+        "SEQUENCE:0",
+    ]
+
+    if description:
+        # Escape special characters in description
+        lines.append(f"DESCRIPTION:{description.translate(_ICAL_ESCAPE)}")
+    if location:
+        lines.append(f"LOCATION:{location.translate(_ICAL_ESCAPE)}")
+
+    # Add attendees (meeting invitations)
+    if attendees:
+        for attendee_email in attendees:
+            # Format: ATTENDEE;CN=email;ROLE=REQ-PARTICIPANT;PARTSTAT=NEEDS-ACTION;RSVP=TRUE:mailto:email
+            lines.append(f"ATTENDEE;CN={attendee_email};CUTYPE=INDIVIDUAL;ROLE=REQ-PARTICIPANT;PARTSTAT=NEEDS-ACTION;RSVP=TRUE:mailto:{attendee_email}")
+
+    lines.append("END:VEVENT")
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(_fold(line) for line in lines) + "\r\n"
+
+
 async def create_event(
     context: Context,
     summary: str,
@@ -294,95 +827,33 @@ async def create_event(
     Returns:
         Created event details
     """
-    email, password = require_auth()
-    client = _get_caldav_client(email, password)
-    principal = client.principal()
-
-    # Get calendar
-    if calendar_id:
-        calendar = caldav.Calendar(client=client, url=calendar_id)
-    else:
-        all_calendars = principal.calendars()
-        if not all_calendars:
-            raise ValueError("No calendars found")
-
-        # Filter out reminder/task calendars - they don't support VEVENT
-        event_calendars = [
-            cal for cal in all_calendars
-            if cal.name and '⚠' not in cal.name and 'reminder' not in cal.name.lower()
-        ]
-
-        if not event_calendars:
-            raise ValueError("No event calendars found (only reminder/task calendars available)")
-
-        calendar = event_calendars[0]
-
-    # Build iCalendar data with proper formatting for iCloud
-    start_dt = datetime.fromisoformat(start)
-    end_dt = datetime.fromisoformat(end)
-    now = datetime.now()
-
-    # Generate UID without dots (iCloud compatible)
-    uid = f"{int(now.timestamp())}{now.microsecond}@icloud-mcp"
-
-    # Build proper iCalendar format (iCloud is very strict about formatting)
-    ical_data = f"""BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//iCloud MCP//EN
-CALSCALE:GREGORIAN
-BEGIN:VEVENT
-UID:{uid}
-DTSTAMP:{now.strftime('%Y%m%dT%H%M%SZ')}
-DTSTART:{start_dt.strftime('%Y%m%dT%H%M%S')}
-DTEND:{end_dt.strftime('%Y%m%dT%H%M%S')}
-SUMMARY:{summary}
-STATUS:CONFIRMED
-SEQUENCE:0
-"""
-
-    if description:
-        # Escape special characters in description
-        desc_escaped = description.replace('\\', '\\\\').replace(',', '\\,').replace(';', '\\;').replace('\n', '\\n')
-        ical_data += f"DESCRIPTION:{desc_escaped}\n"
-    if location:
-        loc_escaped = location.replace('\\', '\\\\').replace(',', '\\,').replace(';', '\\;')
-        ical_data += f"LOCATION:{loc_escaped}\n"
-
-    # Add attendees (meeting invitations)
-    if attendees:
-        for attendee_email in attendees:
-            # Format: ATTENDEE;CN=email;ROLE=REQ-PARTICIPANT;PARTSTAT=NEEDS-ACTION;RSVP=TRUE:mailto:email
-            ical_data += f"ATTENDEE;CN={attendee_email};CUTYPE=INDIVIDUAL;ROLE=REQ-PARTICIPANT;PARTSTAT=NEEDS-ACTION;RSVP=TRUE:mailto:{attendee_email}\n"
-
-    ical_data += "END:VEVENT\nEND:VCALENDAR"
+    email, password, client = _account_client()
+    calendar = _target_calendar(client, calendar_id)
+    ical_data = _build_event_ical(summary, start, end, description, location, attendees)
 
     # Create event using add_event (more reliable than save_event for iCloud)
     try:
-        event = calendar.add_event(ical_data)
+        event = await asyncio.to_thread(calendar.add_event, ical_data)
     except Exception as e:
-        # If add_event fails, try save_event as fallback
+        # No save_event fallback: it is the less reliable path on iCloud
         raise ValueError(f"Failed to create event in calendar '{calendar.name}': {str(e)}")
+    _invalidate_events()
 
-    # Send email invitations to attendees (iTIP protocol)
+    # Send email invitations to attendees (iTIP protocol). SMTP and the IMAP
+    # Sent copy block, so run them off the event loop like the CalDAV calls.
     if attendees:
-        for attendee_email in attendees:
-            try:
-                _send_calendar_invitation(
-                    organizer_email=email,
-                    organizer_password=password,
-                    attendee_email=attendee_email,
-                    ical_data=ical_data,
-                    summary=summary,
-                    start=start,
-                    end=end,
-                    location=location,
-                    method="REQUEST"
-                )
-            except Exception as e:
-                # Log error but don't fail the event creation
-                # The event is already created, we just failed to send the invitation
-                import logging
-                logging.error(f"Failed to send invitation to {attendee_email}: {e}")
+        await asyncio.to_thread(
+            _send_invitations,
+            organizer_email=email,
+            organizer_password=password,
+            attendee_emails=attendees,
+            ical_data=ical_data,
+            summary=summary,
+            start=start,
+            end=end,
+            location=location,
+            method="REQUEST"
+        )
 
     return {
         "id": str(event.url),
@@ -397,6 +868,61 @@ SEQUENCE:0
     }
 
 
+def _add_bulk_event(calendar: "caldav.Calendar", event: Dict[str, Any]) -> "caldav.CalendarObjectResource":
+    """Build and PUT one event of a bulk import (runs in a worker thread)."""
+    ical_data = _build_event_ical(
+        event["summary"],
+        event["start"],
+        event["end"],
+        event.get("description"),
+        event.get("location")
+    )
+    return calendar.add_event(ical_data)
+
+
+async def create_events_bulk(
+    context: Context,
+    events: List[Dict[str, Any]],
+    calendar_id: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Create many events in one calendar.
+
+    CalDAV stores exactly one event (UID) per resource, so the events cannot
+    share a single upload. Instead the target calendar is resolved once and all
+    PUTs run concurrently over the account's cached, pooled client. No
+    invitations are sent.
+
+    Args:
+        events: Events as dicts with summary, start, end (ISO format) and
+            optional description and location
+        calendar_id: Target calendar URL/ID (optional, defaults to first non-reminder calendar)
+
+    Returns:
+        One entry per input event, in order: id/url on success, error otherwise
+    """
+    _, _, client = _account_client()
+    calendar = _target_calendar(client, calendar_id)
+
+    created = await _gather_bounded([partial(_add_bulk_event, calendar, event) for event in events])
+
+    result = []
+    for event, outcome in zip(events, created):
+        summary = event.get("summary", "")
+        if isinstance(outcome, Exception):
+            if isinstance(outcome, KeyError):
+                result.append({"summary": summary, "error": f"Missing field: {outcome.args[0]}"})
+            else:
+                result.append({"summary": summary, "error": str(outcome)})
+        else:
+            result.append({"id": str(outcome.url), "summary": summary, "url": str(outcome.url)})
+
+    if any(not isinstance(outcome, Exception) for outcome in created):
+        _invalidate_events()
+
+    return result
+
+
 async def update_event(
     context: Context,
     event_id: str,
@@ -422,18 +948,18 @@ async def update_event(
     Returns:
         Updated event details
     """
-    email, password = require_auth()
+    import caldav
 
-    # Create a client with the correct base URL for this specific event
-    # This prevents URL joining errors when event is on a different server (e.g., p72-caldav.icloud.com)
-    parsed = urlparse(event_id)
-    event_base_url = f"{parsed.scheme}://{parsed.netloc}"
-    event_client = caldav.DAVClient(url=event_base_url, username=email, password=password)
+    # event_id may live on another shard host (e.g. p72-caldav.icloud.com);
+    # the cached client sends absolute URLs as-is (see delete_event)
+    email, password, client = _account_client()
 
     try:
-        # Load existing event using CalendarObjectResource
-        event = caldav.CalendarObjectResource(client=event_client, url=event_id)
-        event.load()
+        response = await asyncio.to_thread(client.request, event_id)
+        if response.status >= 400:
+            raise Exception(f"HTTP {response.status} {response.reason}")
+        # No client: the wrapper is only used to parse the returned data
+        event = caldav.CalendarObjectResource(url=event_id, data=response.raw)
     except Exception as e:
         raise Exception(f"Error loading event: {str(e)}")
 
@@ -447,22 +973,23 @@ async def update_event(
     if end:
         vevent.dtend.value = datetime.fromisoformat(end)
     if description is not None:
-        if hasattr(vevent, 'description'):
-            vevent.description.value = description
+        description_prop = getattr(vevent, 'description', None)
+        if description_prop is not None:
+            description_prop.value = description
         else:
             vevent.add('description').value = description
     if location is not None:
-        if hasattr(vevent, 'location'):
-            vevent.location.value = location
+        location_prop = getattr(vevent, 'location', None)
+        if location_prop is not None:
+            location_prop.value = location
         else:
             vevent.add('location').value = location
 
     # Update attendees
     if attendees is not None:
         # Remove existing attendees
-        if hasattr(vevent, 'attendee_list'):
-            for att in list(vevent.attendee_list):
-                vevent.remove(att)
+        for att in list(getattr(vevent, 'attendee_list', [])):
+            vevent.remove(att)
 
         # Add new attendees
         for attendee_email in attendees:
@@ -478,50 +1005,52 @@ async def update_event(
     try:
         # Serialize the updated vCalendar data and send PUT request
         updated_ical = event.vobject_instance.serialize()
-        event_client.put(event_id, updated_ical, {"Content-Type": "text/calendar; charset=utf-8"})
+        response = await asyncio.to_thread(
+            client.put, event_id, updated_ical, {"Content-Type": "text/calendar; charset=utf-8"}
+        )
+        if response.status >= 400:
+            raise Exception(f"HTTP {response.status} {response.reason}")
     except Exception as e:
         raise Exception(f"Error saving event: {str(e)}")
+    _invalidate_events()
+
+    # Read the saved values once for the notification and the response
+    summary_prop = getattr(vevent, 'summary', None)
+    description_prop = getattr(vevent, 'description', None)
+    location_prop = getattr(vevent, 'location', None)
+    event_summary = str(summary_prop.value) if summary_prop else ""
+    event_start = _iso_value(getattr(vevent, 'dtstart', None))
+    event_end = _iso_value(getattr(vevent, 'dtend', None))
+    event_location = str(location_prop.value) if location_prop else None
 
     # Extract attendees for response
-    attendee_list = []
-    if hasattr(vevent, 'attendee_list'):
-        for att in vevent.attendee_list:
-            if hasattr(att, 'value'):
-                email_addr = str(att.value).replace('mailto:', '')
-                attendee_list.append(email_addr)
+    attendee_list = [
+        str(att.value).replace('mailto:', '')
+        for att in getattr(vevent, 'attendee_list', [])
+    ]
 
     # Send update notifications to attendees if attendees were modified
     if attendees is not None and attendee_list:
-        event_summary = str(vevent.summary.value) if hasattr(vevent, 'summary') else ""
-        event_start = vevent.dtstart.value.isoformat() if hasattr(vevent, 'dtstart') else start
-        event_end = vevent.dtend.value.isoformat() if hasattr(vevent, 'dtend') else end
-        event_location = str(vevent.location.value) if hasattr(vevent, 'location') else None
-
-        for attendee_email in attendee_list:
-            try:
-                _send_calendar_invitation(
-                    organizer_email=email,
-                    organizer_password=password,
-                    attendee_email=attendee_email,
-                    ical_data=updated_ical,
-                    summary=event_summary,
-                    start=event_start,
-                    end=event_end,
-                    location=event_location,
-                    method="REQUEST"  # Use REQUEST for updates too
-                )
-            except Exception as e:
-                # Log error but don't fail the update
-                import logging
-                logging.error(f"Failed to send update notification to {attendee_email}: {e}")
+        await asyncio.to_thread(
+            _send_invitations,
+            organizer_email=email,
+            organizer_password=password,
+            attendee_emails=attendee_list,
+            ical_data=updated_ical,
+            summary=event_summary,
+            start=event_start or start,
+            end=event_end or end,
+            location=event_location,
+            method="REQUEST"  # Use REQUEST for updates too
+        )
 
     return {
         "id": str(event.url),
-        "summary": str(vevent.summary.value) if hasattr(vevent, 'summary') else "",
-        "start": vevent.dtstart.value.isoformat() if hasattr(vevent, 'dtstart') else None,
-        "end": vevent.dtend.value.isoformat() if hasattr(vevent, 'dtend') else None,
-        "description": str(vevent.description.value) if hasattr(vevent, 'description') else "",
-        "location": str(vevent.location.value) if hasattr(vevent, 'location') else "",
+        "summary": event_summary,
+        "start": event_start,
+        "end": event_end,
+        "description": str(description_prop.value) if description_prop else "",
+        "location": event_location or "",
         "attendees": attendee_list,
         "url": str(event.url)
     }
@@ -537,16 +1066,13 @@ async def delete_event(context: Context, event_id: str) -> Dict[str, str]:
     Returns:
         Confirmation message
     """
-    email, password = require_auth()
-
-    # Create a client with the correct base URL for this specific event
-    # This prevents URL joining errors when event is on a different server (e.g., p72-caldav.icloud.com)
-    parsed = urlparse(event_id)
-    event_base_url = f"{parsed.scheme}://{parsed.netloc}"
-    event_client = caldav.DAVClient(url=event_base_url, username=email, password=password)
+    import caldav
 
-    # Use CalendarObjectResource to handle full URLs correctly
-    event = caldav.CalendarObjectResource(client=event_client, url=event_id)
+    # event_id is a fully qualified URL, possibly on another shard host
+    # (e.g. p72-caldav.icloud.com). DAVClient.request()/delete() send absolute
+    # URLs as-is, so the cached client's pooled session can talk to that host
+    # directly; only caldav's object wrappers try to join it onto client.url.
+    email, password, client = _account_client()
 
     # Load event to get attendees before deleting
     attendee_list = []
@@ -557,24 +1083,27 @@ async def delete_event(context: Context, event_id: str) -> Dict[str, str]:
     ical_data = None
 
     try:
-        event.load()
+        response = await asyncio.to_thread(client.request, event_id)
+        if response.status >= 400:
+            raise Exception(f"HTTP {response.status} {response.reason}")
+        # No client: the wrapper is only used to parse the returned data
+        event = caldav.CalendarObjectResource(url=event_id, data=response.raw)
         vevent = event.vobject_instance.vevent
 
-        # Extract event details
-        event_summary = str(vevent.summary.value) if hasattr(vevent, 'summary') else "Event"
-        if hasattr(vevent, 'dtstart'):
-            event_start = vevent.dtstart.value.isoformat() if hasattr(vevent.dtstart.value, 'isoformat') else str(vevent.dtstart.value)
-        if hasattr(vevent, 'dtend'):
-            event_end = vevent.dtend.value.isoformat() if hasattr(vevent.dtend.value, 'isoformat') else str(vevent.dtend.value)
-        if hasattr(vevent, 'location'):
-            event_location = str(vevent.location.value)
+        # Extract event details, looking each property up once
+        summary_prop = getattr(vevent, 'summary', None)
+        location_prop = getattr(vevent, 'location', None)
+        event_summary = str(summary_prop.value) if summary_prop else "Event"
+        event_start = _iso_value(getattr(vevent, 'dtstart', None)) or ""
+        event_end = _iso_value(getattr(vevent, 'dtend', None)) or ""
+        if location_prop:
+            event_location = str(location_prop.value)
 
         # Extract attendees
-        if hasattr(vevent, 'attendee_list'):
-            for att in vevent.attendee_list:
-                if hasattr(att, 'value'):
-                    email_addr = str(att.value).replace('mailto:', '')
-                    attendee_list.append(email_addr)
+        attendee_list = [
+            str(att.value).replace('mailto:', '')
+            for att in getattr(vevent, 'attendee_list', [])
+        ]
 
         # Get the iCalendar data for CANCEL notifications
         ical_data = event.vobject_instance.serialize()
@@ -584,28 +1113,36 @@ async def delete_event(context: Context, event_id: str) -> Dict[str, str]:
         import logging
         logging.warning(f"Could not load event details before deletion: {e}")
 
-    # Delete the event
-    event.delete()
+    # Delete the event with a single DELETE on the pooled session
+    try:
+        response = await asyncio.to_thread(client.delete, event_id)
+        # 404 means it is already gone, same as caldav's own delete()
+        deleted = response.status in (200, 204, 404)
+    except Exception:
+        deleted = False
+    if not deleted:
+        # Fall back to caldav's object delete through a client bound to the
+        # event's own host
+        parsed = urlparse(event_id)
+        event_base_url = f"{parsed.scheme}://{parsed.netloc}"
+        event_client = caldav.DAVClient(url=event_base_url, username=email, password=password)
+        await asyncio.to_thread(caldav.CalendarObjectResource(client=event_client, url=event_id).delete)
+    _invalidate_events()
 
     # Send cancellation notifications to attendees
     if attendee_list and ical_data:
-        for attendee_email in attendee_list:
-            try:
-                _send_calendar_invitation(
-                    organizer_email=email,
-                    organizer_password=password,
-                    attendee_email=attendee_email,
-                    ical_data=ical_data,
-                    summary=event_summary,
-                    start=event_start,
-                    end=event_end,
-                    location=event_location,
-                    method="CANCEL"
-                )
-            except Exception as e:
-                # Log error but don't fail the deletion
-                import logging
-                logging.error(f"Failed to send cancellation to {attendee_email}: {e}")
+        await asyncio.to_thread(
+            _send_invitations,
+            organizer_email=email,
+            organizer_password=password,
+            attendee_emails=attendee_list,
+            ical_data=ical_data,
+            summary=event_summary,
+            start=event_start,
+            end=event_end,
+            location=event_location,
+            method="CANCEL"
+        )
 
     return {"status": "success", "message": f"Event {event_id} deleted"}
 
@@ -629,16 +1166,153 @@ async def search_events(
     Returns:
         List of matching events
     """
-    # Get all events
-    events = await list_events(context, calendar_id, start_date, end_date)
+    from caldav.elements import cdav
+
+    _, _, client = _account_client()
+    start, end = _parse_date_range(start_date, end_date)
+
+    calendars_to_search = _calendars_to_search(client, calendar_id)
+    if not calendars_to_search:
+        return []
+
+    # Push the text filter to the server with a CalDAV text-match. Prop-filters
+    # within one query are ANDed, so each searched field gets its own REPORT;
+    # all of them run concurrently. The i;ascii-casemap collation only folds
+    # ASCII case ("über" wouldn't match "Über"), so non-ASCII queries skip
+    # this and are matched locally.
+    jobs = []
+    searches: List[Any] = []
+    if query.isascii():
+        jobs = [
+            (cal, partial(
+                cal.search,
+                start=start,
+                end=end,
+                event=True,
+                expand=True,
+                split_expanded=False,
+                filters=[
+                    cdav.PropFilter(field)
+                    + cdav.TextMatch(query, collation="i;ascii-casemap")
+                ]
+            ))
+            for cal in calendars_to_search
+            for field in _SEARCH_FIELDS
+        ]
+        searches = await _gather_bounded([call for _, call in jobs])
+        _invalidate_calendars_on_error(client, searches)
+
+    # Calendars whose text-match REPORTs failed (or weren't sent) are
+    # filtered locally from their full listing instead
+    failed_urls = {str(cal.url) for (cal, _), found in zip(jobs, searches) if isinstance(found, Exception)}
+    fallback_urls = [
+        str(cal.url) for cal in calendars_to_search
+        if not jobs or str(cal.url) in failed_urls
+    ]
+    searched = [
+        (cal, found) for (cal, _), found in zip(jobs, searches)
+        if str(cal.url) not in failed_urls
+    ]
 
-    # Filter by query
+    events = []
+    seen = set()
+    listings = await asyncio.gather(*[
+        list_events(context, url, start_date, end_date) for url in fallback_urls
+    ])
+    for event in _collect_events(
+        [cal for cal, _ in searched], [found for _, found in searched]
+    ) + [event for listing in listings for event in listing]:
+        key = (event["url"], event["start"])
+        if key not in seen:
+            seen.add(key)
+            events.append(event)
+
+    # Filter by query (also a safety net for servers that ignore text-match).
+    # One lowercase + one substring scan per event; the NUL separators stop a
+    # match from spanning two fields.
     query_lower = query.lower()
     filtered_events = [
         event for event in events
-        if query_lower in event.get("summary", "").lower()
-        or query_lower in event.get("description", "").lower()
-        or query_lower in event.get("location", "").lower()
+        if query_lower in "\x00".join((
+            event.get("summary", ""),
+            event.get("description", ""),
+            event.get("location", ""),
+        )).lower()
     ]
 
     return filtered_events
+
+
+def _parse_freebusy(data: str) -> List[Dict[str, Any]]:
+    """Extract busy periods from a VFREEBUSY response without a full parse."""
+    import icalendar
+
+    periods = []
+    # Unfold continuation lines, then only FREEBUSY properties matter
+    for line in _FOLDED_LINE_RE.sub('', data).splitlines():
+        if not line.startswith('FREEBUSY'):
+            continue
+        params, _, value = line.partition(':')
+        fbtype = "BUSY"
+        for param in params.split(';')[1:]:
+            name, _, param_value = param.partition('=')
+            if name.upper() == 'FBTYPE':
+                fbtype = param_value.upper()
+        for period in value.split(','):
+            try:
+                start, end = icalendar.vPeriod.from_ical(period)
+            except Exception as _e:
+                # Skip malformed periods
+                continue
+            if isinstance(end, timedelta):
+                end = start + end
+            periods.append({"start": start.isoformat(), "end": end.isoformat(), "type": fbtype})
+
+    return periods
+
+
+async def get_busy_times(
+    context: Context,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    calendar_id: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Get busy periods with a CalDAV free-busy query.
+
+    The server aggregates busy time itself, so no event data is transferred
+    or parsed.
+
+    Args:
+        start_date: Start date filter in ISO format (YYYY-MM-DD)
+        end_date: End date filter in ISO format (YYYY-MM-DD)
+        calendar_id: Specific calendar URL/ID (optional, defaults to all non-reminder calendars)
+
+    Returns:
+        Busy periods (start, end, type) sorted by start, across the searched calendars
+    """
+    _, _, client = _account_client()
+    start, end = _parse_date_range(start_date, end_date)
+
+    calendars_to_search = _calendars_to_search(client, calendar_id)
+    if not calendars_to_search:
+        return []
+
+    replies = await _gather_bounded([
+        partial(cal.freebusy_request, start, end)
+        for cal in calendars_to_search
+    ])
+    _invalidate_calendars_on_error(client, replies)
+
+    if all(isinstance(reply, Exception) for reply in replies):
+        raise ValueError(f"Free/busy query failed: {replies[0]}")
+
+    result = []
+    for reply in replies:
+        if isinstance(reply, Exception):
+            # Skip calendars that fail to answer
+            continue
+        result.extend(_parse_freebusy(str(reply.data or "")))
+
+    result.sort(key=lambda period: period["start"])
+    return result
@@ -25,6 +25,23 @@ class Config:
     # Email folders
     SENT_FOLDER: str = os.getenv("SENT_FOLDER", "Sent Messages")
 
+    # Messages per IMAP FETCH command (keeps large fetches under server limits)
+    FETCH_BATCH_SIZE: int = int(os.getenv("FETCH_BATCH_SIZE", "100"))
+
+    # Concurrent SMTP sessions per account
+    SMTP_CONCURRENCY: int = int(os.getenv("SMTP_CONCURRENCY", "3"))
+
+    # Seconds a listed account's email folders are served from cache
+    FOLDER_CACHE_TTL: float = float(os.getenv("FOLDER_CACHE_TTL", "90"))
+
+    # Seconds identical email searches are served from cache
+    SEARCH_CACHE_TTL: float = float(os.getenv("SEARCH_CACHE_TTL", "60"))
+
+    # Opt in to keeping searched folders under IMAP IDLE so cached searches
+    # stay valid until they change (one extra, unpooled connection per
+    # watched folder, up to two per account)
+    IMAP_IDLE: bool = os.getenv("IMAP_IDLE", "false").lower() in ("1", "true", "yes")
+
     # OAuth / MCP auth
     MCP_AUTH_TOKEN: Optional[str] = os.getenv("MCP_AUTH_TOKEN")
     MCP_AUTH_PIN: Optional[str] = os.getenv("MCP_AUTH_PIN")
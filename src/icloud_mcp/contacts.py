@@ -1,16 +1,50 @@
 """CardDAV tools for contacts management using direct HTTP/WebDAV requests."""
 
+import io
+import logging
+import re
+import threading
+import time
 import requests
 from requests.auth import HTTPBasicAuth
 import vobject
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional, Tuple
 from mcp.server.fastmcp import Context
 from .auth import require_auth
 from .config import config
+from .utils import _blocking_tool
 import xml.etree.ElementTree as ET
 from urllib.parse import urljoin
+from xml.sax.saxutils import escape as xml_escape
 import uuid
 
+logger = logging.getLogger(__name__)
+
+# Parsed contacts per (account, addressbook URL), stored with the collection's
+# CTag (or sync-token) at the time they were fetched. The tag changes whenever
+# any vCard in the book does, so while it matches, one Depth-0 PROPFIND
+# replaces downloading and parsing the whole address book.
+_CONTACTS_CACHE: Dict[Tuple[str, str], Tuple[str, List[Dict[str, Any]]]] = {}
+_CONTACTS_LOCK = threading.Lock()
+
+# Discovered default addressbook URL per account: (discovered_at, url).
+# Discovery is three PROPFINDs (principal, addressbook home, collections) and
+# its result practically never changes, so it is only redone after the TTL
+# or after a request against the cached URL fails.
+_ADDRESSBOOK_TTL = 600.0
+_ADDRESSBOOK_URLS: Dict[str, Tuple[float, Optional[str]]] = {}
+
+# Properties shown by list/search, matched on unfolded vCard text. Apple
+# groups properties ("item1.EMAIL") and parameter values may be quoted.
+_SUMMARY_PROP_RE = re.compile(
+    r'^(?:[A-Za-z0-9-]+\.)?(FN|TEL|EMAIL|ADR)(?:;(?:"[^"]*"|[^";:\r\n])*)*:([^\r\n]*)',
+    re.IGNORECASE | re.MULTILINE
+)
+_FOLDED_LINE_RE = re.compile(r'\r?\n[ \t]')
+_TEXT_ESCAPE_RE = re.compile(r'\\([\\,;nN])')
+# vCard 2.1 quoted-printable values need vobject's decoder
+_QUOTED_PRINTABLE_RE = re.compile(r'QUOTED-PRINTABLE', re.IGNORECASE)
+
 
 def _get_carddav_session(email: str, password: str) -> tuple:
     """Create authenticated session for CardDAV (stateless)."""
@@ -105,51 +139,262 @@ def _list_addressbooks(session: requests.Session, addressbook_home_url: str) ->
     return addressbooks
 
 
-def _fetch_all_vcards(session: requests.Session, addressbook_url: str) -> List[Dict[str, Any]]:
-    """Fetch all vCards from an addressbook."""
+def _addressbook_ctag(session: requests.Session, addressbook_url: str) -> Optional[str]:
+    """Return the addressbook's CTag (or DAV sync-token), None if unavailable.
+
+    Request failures propagate, so callers can forget a stale addressbook URL;
+    only a response without a usable CTag yields None.
+    """
+    propfind_body = '''<?xml version="1.0" encoding="UTF-8"?>
+    <d:propfind xmlns:d="DAV:" xmlns:cs="http://calendarserver.org/ns/">
+        <d:prop>
+            <cs:getctag/>
+            <d:sync-token/>
+        </d:prop>
+    </d:propfind>'''
+    
+    response = session.request('PROPFIND', addressbook_url, data=propfind_body, headers={'Depth': '0'})
+    response.raise_for_status()
+    try:
+        root = ET.fromstring(response.content)
+    except ET.ParseError as e:
+        logger.debug("Could not read addressbook CTag: %s", e)
+        return None
+    
+    ns = {'d': 'DAV:', 'cs': 'http://calendarserver.org/ns/'}
+    for path in ('.//cs:getctag', './/d:sync-token'):
+        elem = root.find(path, ns)
+        if elem is not None and elem.text:
+            return elem.text
+    return None
+
+
+def _cached_contacts(email: str, addressbook_url: str, ctag: Optional[str]) -> Optional[List[Dict[str, Any]]]:
+    """Return the cached contacts for this book if its CTag still matches."""
+    if ctag is None:
+        return None
+    with _CONTACTS_LOCK:
+        cached = _CONTACTS_CACHE.get((email, addressbook_url))
+    if cached is not None and cached[0] == ctag:
+        return cached[1]
+    return None
+
+
+def _invalidate_contacts(email: str) -> None:
+    """Drop every cached addressbook of this account after a write."""
+    with _CONTACTS_LOCK:
+        for key in [key for key in _CONTACTS_CACHE if key[0] == email]:
+            del _CONTACTS_CACHE[key]
+
+
+def _text_match_filter(query: str) -> str:
+    """Build an addressbook-query filter matching FN, EMAIL or TEL (RFC 6352 10.5)."""
+    text = xml_escape(query)
+    prop_filters = ''.join(
+        f'''
+            <card:prop-filter name="{name}">
+                <card:text-match collation="i;unicode-casemap" match-type="contains">{text}</card:text-match>
+            </card:prop-filter>'''
+        for name in ('FN', 'EMAIL', 'TEL')
+    )
+    return f'''
+        <card:filter test="anyof">{prop_filters}
+        </card:filter>'''
+
+
+def _fetch_all_vcards(
+    session: requests.Session,
+    addressbook_url: str,
+    text_match: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """Fetch vCards from an addressbook in one REPORT and yield them as parsed.
+
+    The multistatus body is parsed incrementally and each response element
+    is discarded once yielded, so callers that stop early (list limits)
+    skip the rest and no full tree or list of all vCards is built. A failed
+    REPORT raises, so callers can forget a stale addressbook URL.
+
+    Args:
+        session: Authenticated CardDAV session
+        addressbook_url: Addressbook collection URL
+        text_match: Only fetch vCards whose FN, EMAIL or TEL contains this text
+            (filtered server-side; falls back to fetching everything if the
+            server rejects the filter)
+
+    Yields:
+        Dicts with url, data and etag
+    """
     # Make sure URL ends with /
     if not addressbook_url.endswith('/'):
         addressbook_url += '/'
     
-    query_body = '''<?xml version="1.0" encoding="UTF-8"?>
+    query_body = f'''<?xml version="1.0" encoding="UTF-8"?>
     <card:addressbook-query xmlns:d="DAV:" xmlns:card="urn:ietf:params:xml:ns:carddav">
         <d:prop>
             <d:getetag/>
             <card:address-data/>
-        </d:prop>
+        </d:prop>{_text_match_filter(text_match) if text_match else ''}
     </card:addressbook-query>'''
     
     try:
         response = session.request('REPORT', addressbook_url, data=query_body, headers={'Depth': '1'})
         response.raise_for_status()
     except Exception as e:
-        print(f"Error fetching vCards: {str(e)}")
-        return []
+        if text_match:
+            logger.error("Server-side contact search failed: %s. Fetching all vCards.", e)
+            yield from _fetch_all_vcards(session, addressbook_url)
+            return
+        raise
     
     # Parse XML response
-    vcards = []
+    ns = {'d': 'DAV:', 'card': 'urn:ietf:params:xml:ns:carddav'}
     try:
-        root = ET.fromstring(response.content)
-        ns = {'d': 'DAV:', 'card': 'urn:ietf:params:xml:ns:carddav'}
-        
-        for response_elem in root.findall('.//d:response', ns):
+        for _, response_elem in ET.iterparse(io.BytesIO(response.content), events=('end',)):
+            if response_elem.tag != '{DAV:}response':
+                continue
             href_elem = response_elem.find('d:href', ns)
             vcard_data_elem = response_elem.find('.//card:address-data', ns)
             etag_elem = response_elem.find('.//d:getetag', ns)
             
             if vcard_data_elem is not None and vcard_data_elem.text:
-                vcards.append({
+                vcard = {
                     'url': urljoin(addressbook_url, href_elem.text) if href_elem is not None else '',
                     'data': vcard_data_elem.text,
                     'etag': etag_elem.text if etag_elem is not None else ''
-                })
-    except Exception as e:
-        print(f"Error parsing vCards: {str(e)}")
+                }
+                response_elem.clear()
+                yield vcard
+            else:
+                response_elem.clear()
+    except ET.ParseError as e:
+        logger.error("Error parsing vCards: %s", e)
+
+
+def _default_addressbook_url(session: requests.Session, email: str) -> Optional[str]:
+    """Return the account's first addressbook (None if it has none), cached per account."""
+    now = time.monotonic()
+    with _CONTACTS_LOCK:
+        cached = _ADDRESSBOOK_URLS.get(email)
+    if cached is not None and now - cached[0] < _ADDRESSBOOK_TTL:
+        return cached[1]
     
-    return vcards
+    principal_url = _discover_principal(session, config.CARDDAV_SERVER)
+    addressbook_home_url = _discover_addressbook_home(session, principal_url)
+    addressbooks = _list_addressbooks(session, addressbook_home_url)
+    url = addressbooks[0]['url'] if addressbooks else None
+    with _CONTACTS_LOCK:
+        _ADDRESSBOOK_URLS[email] = (now, url)
+    return url
+
+
+def _forget_addressbook_url(email: str) -> None:
+    """Force rediscovery of the account's addressbook on the next call."""
+    with _CONTACTS_LOCK:
+        _ADDRESSBOOK_URLS.pop(email, None)
+
+
+def _unescape_text(value: str) -> str:
+    """Undo vCard TEXT escaping (backslash sequences, \\n for newline)."""
+    return _TEXT_ESCAPE_RE.sub(lambda m: '\n' if m.group(1) in 'nN' else m.group(1), value)
+
 
+def _scan_summary_fields(data: str) -> Tuple[str, List[str], List[str], List[str]]:
+    """Extract name, phones, emails and addresses with a single regex scan.
 
-async def list_contacts(
+    Much cheaper than a full vobject parse for the few properties listings
+    show; addresses are still formatted by vobject's Address class.
+    """
+    name = None
+    phones = []
+    emails = []
+    addresses = []
+    for match in _SUMMARY_PROP_RE.finditer(_FOLDED_LINE_RE.sub('', data)):
+        prop = match.group(1).upper()
+        value = match.group(2)
+        if prop == 'FN':
+            if name is None:
+                name = _unescape_text(value)
+        elif prop == 'ADR':
+            fields = vobject.vcard.splitFields(value)
+            addr_str = str(vobject.vcard.Address(**dict(zip(vobject.vcard.ADDRESS_ORDER, fields))))
+            if addr_str:
+                addresses.append(addr_str)
+        elif value:
+            (phones if prop == 'TEL' else emails).append(_unescape_text(value))
+    return name or "", phones, emails, addresses
+
+
+def _parse_summary_fields(data: str) -> Tuple[str, List[str], List[str], List[str]]:
+    """Extract name, phones, emails and addresses via a full vobject parse."""
+    vcard = vobject.readOne(data)
+    name = ""
+    phones = []
+    emails = []
+    addresses = []
+    
+    # Extract name
+    if hasattr(vcard, 'fn') and vcard.fn and hasattr(vcard.fn, 'value'):
+        name = str(vcard.fn.value)
+    
+    # Extract phone numbers
+    if hasattr(vcard, 'tel_list'):
+        for tel in vcard.tel_list:
+            if hasattr(tel, 'value') and tel.value:
+                phones.append(str(tel.value))
+    
+    # Extract emails
+    if hasattr(vcard, 'email_list'):
+        for em in vcard.email_list:
+            if hasattr(em, 'value') and em.value:
+                emails.append(str(em.value))
+    
+    # Extract addresses
+    if hasattr(vcard, 'adr_list'):
+        for adr in vcard.adr_list:
+            if hasattr(adr, 'value'):
+                try:
+                    addr_str = str(adr.value) if adr.value else ""
+                    if addr_str:
+                        addresses.append(addr_str)
+                except (TypeError, ValueError) as _e:
+                    continue
+    
+    return name, phones, emails, addresses
+
+
+def _vcard_to_contact(vcard_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Parse a fetched vCard into a contact summary.
+
+    Returns None for unparseable vCards and for ones with no name, phone or
+    email.
+    """
+    data = vcard_data['data']
+    if 'BEGIN:VCARD' not in data:
+        return None
+    try:
+        if _QUOTED_PRINTABLE_RE.search(data):
+            name, phones, emails, addresses = _parse_summary_fields(data)
+        else:
+            name, phones, emails, addresses = _scan_summary_fields(data)
+    except (vobject.base.ParseError, ValueError, KeyError) as e:
+        logger.debug("Error parsing vCard: %s", e)
+        return None
+    
+    # Only keep the contact if it has a name or at least one other field
+    if not (name or phones or emails):
+        return None
+    return {
+        "id": vcard_data['url'],
+        "name": name,
+        "phones": phones,
+        "emails": emails,
+        "addresses": addresses,
+        "url": vcard_data['url']
+    }
+
+
+@_blocking_tool
+def list_contacts(
     context: Context,
     limit: Optional[int] = None
 ) -> List[Dict[str, Any]]:
@@ -166,84 +411,38 @@ async def list_contacts(
     session, _ = _get_carddav_session(email, password)
     
     try:
-        # Discover URLs
-        base_url = config.CARDDAV_SERVER
-        principal_url = _discover_principal(session, base_url)
-        addressbook_home_url = _discover_addressbook_home(session, principal_url)
-        addressbooks = _list_addressbooks(session, addressbook_home_url)
-        
-        if not addressbooks:
+        addressbook_url = _default_addressbook_url(session, email)
+        if addressbook_url is None:
             return []
         
-        # Use first addressbook
-        addressbook_url = addressbooks[0]['url']
-        
-        # Fetch all vCards
-        vcards = _fetch_all_vcards(session, addressbook_url)
-        
-        # Parse vCards
-        result = []
-        count = 0
-        
-        for vcard_data in vcards:
-            if limit and count >= limit:
-                break
+        ctag = _addressbook_ctag(session, addressbook_url)
+        result = _cached_contacts(email, addressbook_url, ctag)
+        if result is None:
+            # Fetch all vCards
+            vcards = _fetch_all_vcards(session, addressbook_url)
             
-            try:
-                vcard = vobject.readOne(vcard_data['data'])
-                
-                contact = {
-                    "id": vcard_data['url'],
-                    "name": "",
-                    "phones": [],
-                    "emails": [],
-                    "addresses": [],
-                    "url": vcard_data['url']
-                }
-                
-                # Extract name
-                if hasattr(vcard, 'fn') and vcard.fn and hasattr(vcard.fn, 'value'):
-                    contact["name"] = str(vcard.fn.value)
-                
-                # Extract phone numbers
-                if hasattr(vcard, 'tel_list'):
-                    for tel in vcard.tel_list:
-                        if hasattr(tel, 'value') and tel.value:
-                            contact["phones"].append(str(tel.value))
-                
-                # Extract emails
-                if hasattr(vcard, 'email_list'):
-                    for em in vcard.email_list:
-                        if hasattr(em, 'value') and em.value:
-                            contact["emails"].append(str(em.value))
-                
-                # Extract addresses
-                if hasattr(vcard, 'adr_list'):
-                    for adr in vcard.adr_list:
-                        if hasattr(adr, 'value'):
-                            try:
-                                addr_str = str(adr.value) if adr.value else ""
-                                if addr_str:
-                                    contact["addresses"].append(addr_str)
-                            except Exception as _e:
-                                continue
-                
-                # Only add contact if it has a name or at least one other field
-                if contact["name"] or contact["phones"] or contact["emails"]:
+            # Parse vCards (all of them when the result can be cached)
+            result = []
+            for vcard_data in vcards:
+                if limit and ctag is None and len(result) >= limit:
+                    break
+                contact = _vcard_to_contact(vcard_data)
+                if contact is not None:
                     result.append(contact)
-                    count += 1
             
-            except Exception as e:
-                print(f"Error parsing vCard: {str(e)}")
-                continue
+            if ctag is not None:
+                with _CONTACTS_LOCK:
+                    _CONTACTS_CACHE[(email, addressbook_url)] = (ctag, result)
         
-        return result
+        return result[:limit] if limit else list(result)
     
     except Exception as e:
+        _forget_addressbook_url(email)
         raise ValueError(f"Failed to list contacts: {str(e)}")
 
 
-async def get_contact(context: Context, contact_id: str) -> Dict[str, Any]:
+@_blocking_tool
+def get_contact(context: Context, contact_id: str) -> Dict[str, Any]:
     """
     Get a specific contact by ID.
 
@@ -294,7 +493,8 @@ async def get_contact(context: Context, contact_id: str) -> Dict[str, Any]:
         raise ValueError(f"Failed to get contact: {str(e)}")
 
 
-async def create_contact(
+@_blocking_tool
+def create_contact(
     context: Context,
     name: str,
     phones: Optional[List[str]] = None,
@@ -321,16 +521,10 @@ async def create_contact(
     session, _ = _get_carddav_session(email, password)
     
     try:
-        # Discover URLs
-        base_url = config.CARDDAV_SERVER
-        principal_url = _discover_principal(session, base_url)
-        addressbook_home_url = _discover_addressbook_home(session, principal_url)
-        addressbooks = _list_addressbooks(session, addressbook_home_url)
-        
-        if not addressbooks:
+        addressbook_url = _default_addressbook_url(session, email)
+        if addressbook_url is None:
             raise ValueError("No addressbooks found")
         
-        addressbook_url = addressbooks[0]['url']
         if not addressbook_url.endswith('/'):
             addressbook_url += '/'
         
@@ -383,6 +577,7 @@ async def create_contact(
             headers={'Content-Type': 'text/vcard; charset=utf-8'}
         )
         response.raise_for_status()
+        _invalidate_contacts(email)
         
         return {
             "id": contact_url,
@@ -396,10 +591,12 @@ async def create_contact(
         }
     
     except Exception as e:
+        _forget_addressbook_url(email)
         raise ValueError(f"Failed to create contact: {str(e)}")
 
 
-async def update_contact(
+@_blocking_tool
+def update_contact(
     context: Context,
     contact_id: str,
     name: Optional[str] = None,
@@ -492,6 +689,7 @@ async def update_contact(
         
         response = session.put(contact_id, data=vcard_data, headers=headers)
         response.raise_for_status()
+        _invalidate_contacts(email)
         
         return {
             "id": contact_id,
@@ -508,7 +706,8 @@ async def update_contact(
         raise ValueError(f"Failed to update contact: {str(e)}")
 
 
-async def delete_contact(context: Context, contact_id: str) -> Dict[str, str]:
+@_blocking_tool
+def delete_contact(context: Context, contact_id: str) -> Dict[str, str]:
     """
     Delete a contact.
 
@@ -524,6 +723,7 @@ async def delete_contact(context: Context, contact_id: str) -> Dict[str, str]:
     try:
         response = session.delete(contact_id)
         response.raise_for_status()
+        _invalidate_contacts(email)
         
         return {"status": "success", "message": f"Contact {contact_id} deleted"}
     
@@ -531,7 +731,8 @@ async def delete_contact(context: Context, contact_id: str) -> Dict[str, str]:
         raise ValueError(f"Failed to delete contact: {str(e)}")
 
 
-async def search_contacts(
+@_blocking_tool
+def search_contacts(
     context: Context,
     query: str
 ) -> List[Dict[str, Any]]:
@@ -544,10 +745,27 @@ async def search_contacts(
     Returns:
         List of matching contacts
     """
-    # Get all contacts
-    contacts = await list_contacts(context)
+    email, password = require_auth()
+    session, _ = _get_carddav_session(email, password)
+    
+    try:
+        addressbook_url = _default_addressbook_url(session, email)
+        if addressbook_url is None:
+            return []
+        
+        # An up-to-date cached copy of the book answers the search locally.
+        # Otherwise let the server filter (addressbook-query text-match) so
+        # only candidate vCards are downloaded and parsed.
+        contacts = _cached_contacts(email, addressbook_url, _addressbook_ctag(session, addressbook_url))
+        if contacts is None:
+            vcards = _fetch_all_vcards(session, addressbook_url, text_match=query)
+            contacts = [c for c in map(_vcard_to_contact, vcards) if c is not None]
+    
+    except Exception as e:
+        _forget_addressbook_url(email)
+        raise ValueError(f"Failed to search contacts: {str(e)}")
     
-    # Filter by query
+    # Filter by query (also drops server matches on fields we don't return)
     query_lower = query.lower()
     filtered_contacts = [
         contact for contact in contacts
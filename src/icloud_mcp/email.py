@@ -1,20 +1,32 @@
 """IMAP/SMTP tools for email management."""
 
+import base64
+import binascii
+import contextlib
+import functools
 import imaplib
+import quopri
+import re
 import smtplib
 import email
+import hashlib
 import logging
 import sys
 import os
+import threading
+import time
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from email.header import decode_header
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import format_datetime
+from typing import Callable, Iterator, List, Dict, Any, Optional, Tuple
+from datetime import date, datetime
 from mcp.server.fastmcp import Context
 from imapclient import IMAPClient
+from imapclient.exceptions import IMAPClientAbortError
 from .auth import require_auth
 from .config import config
+from .utils import _blocking_tool
 
 # Configure minimal logging (only errors)
 logger = logging.getLogger(__name__)
@@ -27,86 +39,797 @@ stderr_handler.setLevel(logging.ERROR)
 stderr_handler.setFormatter(formatter)
 logger.addHandler(stderr_handler)
 
+# Idle, logged-in IMAP connections keyed by (username, sha256(password)).
+# TLS + LOGIN costs several hundred ms against iCloud, far more than the
+# commands a tool actually runs, so connections are checked back in after use
+# instead of being closed. IMAP is stateful (selected folder, in-flight
+# commands), so each connection is checked out by one caller at a time.
+_IMAP_POOL_SIZE = 4  # idle connections kept per account
+_IMAP_POOL: Dict[Tuple[str, str], List[Tuple[IMAPClient, float]]] = {}
+_IMAP_POOL_LOCK = threading.Lock()
+# iCloud drops connections idle for ~29 minutes; retire ours well before that
+_IMAP_IDLE_TIMEOUT = 20 * 60.0
+# Listing entries (minus flags) by (pool key, folder, UIDVALIDITY) -> {UID: entry}.
+# A message's ENVELOPE never changes once delivered, so repeat listings only
+# need FLAGS for messages seen before.
+_ENVELOPE_CACHE: Dict[Tuple[Any, str, int], Dict[int, Dict[str, Any]]] = {}
+_ENVELOPE_CACHE_LOCK = threading.Lock()
+_ENVELOPE_CACHE_FOLDERS = 64  # folders kept, least recently listed dropped first
+_ENVELOPE_CACHE_SIZE = 2000  # entries kept per folder
+# Decoded get_message() bodies by (pool key, folder, UID, INTERNALDATE,
+# full_html) -> (body_text, body_html). Message content never changes, so
+# rereading a message skips fetching and decoding its text parts.
+_BODY_CACHE: Dict[Tuple[Any, str, int, Any, bool], Tuple[str, str]] = {}
+_BODY_CACHE_LOCK = threading.Lock()
+_BODY_CACHE_SIZE = 64  # messages kept, least recently read dropped first
+# Logged-in SMTP sessions, pooled like the IMAP connections above. Servers
+# drop idle SMTP sessions within minutes, so they are only kept briefly.
+_SMTP_POOL_SIZE = 2
+_SMTP_POOL: Dict[Tuple[str, str], List[Tuple[smtplib.SMTP, float]]] = {}
+_SMTP_POOL_LOCK = threading.Lock()
+_SMTP_IDLE_TIMEOUT = 60.0
+_SMTP_SLOTS: Dict[Tuple[str, str], threading.BoundedSemaphore] = {}
+
+# list_folders() results per pool key: (fetched_at, folders)
+_FOLDER_CACHE: Dict[Tuple[str, str], Tuple[float, List[Dict[str, Any]]]] = {}
+_FOLDER_CACHE_LOCK = threading.Lock()
+
+# search_messages() results by (pool key, folder, lowercased query, limit, since):
+# (searched_at, results); at most _SEARCH_CACHE_SIZE, oldest dropped first
+_SEARCH_CACHE: Dict[Tuple[Any, str, str, int, Optional[date]], Tuple[float, List[Dict[str, Any]]]] = {}
+_SEARCH_CACHE_LOCK = threading.Lock()
+_SEARCH_CACHE_SIZE = 128
+
+# IMAP IDLE (RFC 2177) watchers by (pool key, folder). Each holds its own
+# connection (IDLE monopolizes one) and drops the folder's cached searches as
+# soon as the server reports a change, so they can outlive SEARCH_CACHE_TTL.
+# State: armed (IDLE start, None between commands), changed (last change
+# seen), last_used (last cached search of the folder).
+_IDLE_WATCHERS: Dict[Tuple[Any, str], Dict[str, Any]] = {}
+_IDLE_WATCHERS_LOCK = threading.Lock()
+_IDLE_UNSUPPORTED: set = set()  # pool keys whose server lacks IDLE
+# When a watcher last failed, by (pool key, folder); not restarted before
+# _IDLE_RETRY_AFTER so a refused connection or LOGIN isn't retried per search
+_IDLE_FAILED: Dict[Tuple[Any, str], float] = {}
+_IDLE_RETRY_AFTER = 300.0
+_IDLE_MAX_FOLDERS = 2           # watched folders per account
+_IDLE_LINGER = 600.0            # stop watching after this long without a search
+_IDLE_REARM = 28 * 60.0         # re-issue IDLE before the 29-minute server timeout
+_IDLE_CHANGES = (b'EXISTS', b'EXPUNGE', b'FETCH', b'RECENT')
+
+# get_messages() opens another pooled connection per this many messages
+_MESSAGES_PER_CONNECTION = 50
+# Headers returned by get_message(s); bodies are fetched per MIME part
+_MESSAGE_HEADER_FIELDS = b'BODY.PEEK[HEADER.FIELDS (SUBJECT FROM TO CC DATE)]'
+
+# RFC 2047 encoded words ("=?charset?B|Q?text?=") and the gaps between them
+_ENCODED_WORD_RE = re.compile(r'=\?([^?\s]+)\?([QqBb])\?([^?\s]*)\?=')
+_ENCODED_WORD_GAP_RE = re.compile(r'(\?=)\s+(=\?)')
+
+# Separator in comma-separated recipient lists (cc/bcc), eating surrounding spaces
+_ADDRESS_SPLIT_RE = re.compile(r'\s*,\s*')
+
+# Display names containing these must be quoted (RFC 5322 specials)
+_ADDRESS_SPECIALS_RE = re.compile(r'[][\\()<>@,:;".]')
+
+# Errors after which a connection can't be trusted to be in sync any more
+_IMAP_BROKEN_ERRORS = (IMAPClientAbortError, imaplib.IMAP4.abort, OSError)
+
+
+def _imap_key(username: str, password: str) -> Tuple[str, str]:
+    """Pool key for an account (the password is only kept hashed)."""
+    return (username, hashlib.sha256(password.encode()).hexdigest())
+
+
+def _shutdown_imap_client(client: IMAPClient) -> None:
+    """Close the connection's socket without logging out."""
+    try:
+        # Don't call logout() - it causes "file property has no setter" error in Python 3.14+
+        # Just close the underlying socket
+        if hasattr(client, '_imap') and hasattr(client._imap, 'sock'):
+            client._imap.sock.close()
+    except OSError as _e:
+        pass  # Silently ignore errors on close
+
 
 def _get_imap_client(username: str, password: str) -> IMAPClient:
-    """Create IMAP client (stateless)."""
+    """Check out a logged-in IMAP client, reusing a pooled connection if possible.
+
+    Pooled connections are verified with a NOOP before being handed out;
+    dead or stale ones are closed and a fresh connection is opened instead.
+    Return the client with _close_imap_client() when done.
+    """
+    key = _imap_key(username, password)
+    now = time.monotonic()
+    while True:
+        with _IMAP_POOL_LOCK:
+            idle = _IMAP_POOL.get(key)
+            if not idle:
+                break
+            client, last_used = idle.pop()
+        if now - last_used > _IMAP_IDLE_TIMEOUT:
+            _shutdown_imap_client(client)
+            continue
+        try:
+            client.noop()
+        except Exception as _e:
+            _shutdown_imap_client(client)
+            continue
+        return client
+
     client = IMAPClient(config.IMAP_SERVER, port=config.IMAP_PORT, ssl=True, use_uid=True)
     client.login(username, password)
+    client._pool_key = key
     return client
 
 
 def _close_imap_client(client: IMAPClient) -> None:
-    """Safely close IMAP client connection."""
-    try:
-        # Don't call logout() - it causes "file property has no setter" error in Python 3.14+
-        # Just close the underlying socket
-        if hasattr(client, '_imap') and hasattr(client._imap, 'sock'):
-            client._imap.sock.close()
-    except Exception as _e:
-        pass  # Silently ignore errors on close
+    """Check an IMAP client back into the pool (or close it).
+
+    Callers release clients from a ``finally`` block, so an exception that is
+    propagating is visible here: connections that failed at the socket or
+    protocol level are closed rather than reused.
+    """
+    key = getattr(client, '_pool_key', None)
+    if key is None or isinstance(sys.exc_info()[1], _IMAP_BROKEN_ERRORS):
+        _shutdown_imap_client(client)
+        return
+
+    now = time.monotonic()
+    stale = []
+    with _IMAP_POOL_LOCK:
+        # Retire connections every account has left idle too long
+        for pool_key, idle in list(_IMAP_POOL.items()):
+            fresh = [(c, t) for c, t in idle if now - t <= _IMAP_IDLE_TIMEOUT]
+            stale.extend(c for c, t in idle if now - t > _IMAP_IDLE_TIMEOUT)
+            if fresh:
+                _IMAP_POOL[pool_key] = fresh
+            else:
+                del _IMAP_POOL[pool_key]
+
+        idle = _IMAP_POOL.setdefault(key, [])
+        if len(idle) < _IMAP_POOL_SIZE:
+            idle.append((client, now))
+            client = None
+
+    for old in stale:
+        _shutdown_imap_client(old)
+    if client is not None:
+        _shutdown_imap_client(client)
+
+
+def _smtp_slots(key: Tuple[str, str]) -> threading.BoundedSemaphore:
+    """Semaphore bounding an account's concurrent SMTP sessions."""
+    with _SMTP_POOL_LOCK:
+        slots = _SMTP_SLOTS.get(key)
+        if slots is None:
+            slots = _SMTP_SLOTS[key] = threading.BoundedSemaphore(max(1, config.SMTP_CONCURRENCY))
+        return slots
 
 
 def _get_smtp_client(username: str, password: str) -> smtplib.SMTP:
-    """Create SMTP client (stateless)."""
+    """Check out a logged-in SMTP client, reusing a pooled session if possible.
+
+    At most config.SMTP_CONCURRENCY sessions per account are checked out at
+    once (iCloud throttles accounts that open many); further senders wait for
+    a session to be returned. Pooled sessions are verified with a NOOP; a
+    session the server has dropped is replaced by a fresh connect + STARTTLS
+    + LOGIN. Return the client with _close_smtp_client() when done.
+    """
+    key = _imap_key(username, password)
+    slots = _smtp_slots(key)
+    slots.acquire()
+    try:
+        return _checkout_smtp_client(key, username, password)
+    except BaseException:
+        slots.release()
+        raise
+
+
+def _checkout_smtp_client(key: Tuple[str, str], username: str, password: str) -> smtplib.SMTP:
+    """Take a live pooled SMTP session for ``key``, or log in a new one."""
+    now = time.monotonic()
+    while True:
+        with _SMTP_POOL_LOCK:
+            idle = _SMTP_POOL.get(key)
+            if not idle:
+                break
+            client, last_used = idle.pop()
+        if now - last_used > _SMTP_IDLE_TIMEOUT:
+            _shutdown_smtp_client(client)
+            continue
+        try:
+            if client.noop()[0] == 250:
+                return client
+        except (smtplib.SMTPException, OSError) as _e:
+            pass
+        _shutdown_smtp_client(client)
+
     client = smtplib.SMTP(config.SMTP_SERVER, config.SMTP_PORT)
     client.starttls()
     client.login(username, password)
+    client._pool_key = key
     return client
 
 
+def _shutdown_smtp_client(client: smtplib.SMTP) -> None:
+    """End an SMTP session, ignoring a connection that is already gone."""
+    try:
+        client.quit()
+    except (smtplib.SMTPException, OSError) as _e:
+        client.close()
+
+
+def _close_smtp_client(client: smtplib.SMTP) -> None:
+    """Check an SMTP client back into the pool (or end its session).
+
+    As with _close_imap_client(), a session whose connection failed while
+    an exception is propagating is closed rather than reused.
+    """
+    key = getattr(client, '_pool_key', None)
+    try:
+        if key is None or isinstance(sys.exc_info()[1], (smtplib.SMTPServerDisconnected, OSError)):
+            _shutdown_smtp_client(client)
+            return
+        with _SMTP_POOL_LOCK:
+            idle = _SMTP_POOL.setdefault(key, [])
+            if len(idle) < _SMTP_POOL_SIZE:
+                idle.append((client, time.monotonic()))
+                return
+        _shutdown_smtp_client(client)
+    finally:
+        if key is not None:
+            _smtp_slots(key).release()
+
+
+def _decode_word_bytes(raw: bytes, charset: str) -> str:
+    """Decode the bytes of one or more adjacent encoded words."""
+    try:
+        return raw.decode(charset, errors='ignore')
+    except LookupError:
+        return raw.decode('utf-8', errors='ignore')
+
+
+@functools.lru_cache(maxsize=4096)
 def _decode_mime_header(header_value: str) -> str:
-    """Decode MIME encoded email header."""
-    if not header_value:
-        return ""
+    """Decode MIME encoded email header.
+
+    Cached: the same From addresses and subjects recur across listings and
+    pages. Values without encoded words are returned as-is; the rest are
+    decoded with the C base64/quoted-printable codecs. Adjacent words in the
+    same charset are decoded together, since senders split multi-byte
+    characters across them.
+    """
+    if not header_value or '=?' not in header_value:
+        return header_value or ""
 
-    decoded_parts = decode_header(header_value)
+    # Whitespace between adjacent encoded words is not part of the text
+    value = _ENCODED_WORD_GAP_RE.sub(r'\1\2', header_value)
     result = []
+    pending = b''
+    pending_charset = None
+    pos = 0
+    for match in _ENCODED_WORD_RE.finditer(value):
+        charset, encoding, text = match.groups()
+        try:
+            if encoding in 'Bb':
+                raw = binascii.a2b_base64(text + '=' * (-len(text) % 4))
+            else:
+                raw = binascii.a2b_qp(text, header=True)
+        except (binascii.Error, ValueError) as _e:
+            # Leave malformed words as they are
+            continue
+
+        # RFC 2231 allows a language suffix (charset*lang)
+        charset = charset.split('*', 1)[0].lower()
+        if match.start() != pos or charset != pending_charset:
+            if pending:
+                result.append(_decode_word_bytes(pending, pending_charset))
+                pending = b''
+            result.append(value[pos:match.start()])
+        pending += raw
+        pending_charset = charset
+        pos = match.end()
+
+    if pending:
+        result.append(_decode_word_bytes(pending, pending_charset))
+    result.append(value[pos:])
+    return ''.join(result)
+
+
+def _decode_flag(flag: Any) -> str:
+    """IMAP flags arrive as bytes; tools return them as str."""
+    return flag.decode() if isinstance(flag, bytes) else flag
+
+
+def _message_flags(data: Dict[Any, Any]) -> List[str]:
+    """Decoded FLAGS of a FETCH response item."""
+    flags = data.get(b'FLAGS')
+    if flags is None:
+        flags = data.get('FLAGS', ())
+    return list(map(_decode_flag, flags))
+
+
+def _header_bytes(data: Dict[Any, Any]) -> Optional[bytes]:
+    """Return the header block from a FETCH response item, if present.
+
+    The response key echoes the fetched section (e.g. ``BODY[HEADER]`` or
+    ``BODY[HEADER.FIELDS (...)]``) in whatever form the server chose, so
+    match on the prefix rather than an exact key.
+    """
+    for key, value in data.items():
+        name = key if isinstance(key, bytes) else str(key).encode()
+        if name.upper().startswith(b'BODY[HEADER'):
+            return value
+    return None
 
-    for content, charset in decoded_parts:
-        if isinstance(content, bytes):
-            try:
-                result.append(content.decode(charset or 'utf-8', errors='ignore'))
-            except Exception as _e:
-                result.append(content.decode('utf-8', errors='ignore'))
-        else:
-            result.append(str(content))
 
-    return ' '.join(result)
+def _text_parts(structure: Any, section: str = '') -> Any:
+    """Yield (section, subtype, encoding, charset) for a message's inline text parts.
 
+    Walks an IMAP BODYSTRUCTURE (as parsed by IMAPClient) in MIME order. Parts
+    are numbered the way BODY[section] expects; a single-part message is
+    section 1. Attachments and non-text parts are skipped, except that the
+    body of a single-part text message is always reported as plain text.
+    """
+    if isinstance(structure[0], list):
+        for index, part in enumerate(structure[0], 1):
+            yield from _text_parts(part, f'{section}.{index}' if section else str(index))
+        return
+
+    if not isinstance(structure[0], bytes) or structure[0].upper() != b'TEXT':
+        return
+    subtype = structure[1].decode().lower()
+    if section:
+        if subtype not in ('plain', 'html'):
+            return
+        disposition = structure[9] if len(structure) > 9 else None
+        if disposition and disposition[0] and disposition[0].upper() == b'ATTACHMENT':
+            return
+    else:
+        subtype = 'plain'
+
+    params = structure[2] or ()
+    charset = ''
+    for name, value in zip(params[::2], params[1::2]):
+        if name.upper() == b'CHARSET' and value:
+            charset = value.decode()
+    encoding = (structure[5] or b'7BIT').decode().lower()
+    yield section or '1', subtype, encoding, charset
+
+
+def _decode_part(raw: Optional[bytes], encoding: str, charset: str) -> str:
+    """Undo a fetched part's transfer encoding and decode it with its charset.
+
+    Parts without a usable charset are read as UTF-8, or as Latin-1 when they
+    aren't valid UTF-8, instead of silently dropping the non-UTF-8 bytes.
+    """
+    if not raw:
+        return ""
+    try:
+        if encoding == 'base64':
+            raw = base64.b64decode(raw)
+        elif encoding == 'quoted-printable':
+            raw = quopri.decodestring(raw)
+    except (binascii.Error, ValueError):
+        pass
+    if charset:
+        try:
+            return raw.decode(charset)
+        except UnicodeDecodeError:
+            # Declared charset, a few stray bytes: keep the rest of the text
+            return raw.decode(charset, errors='replace')
+        except LookupError:
+            pass
+    try:
+        return raw.decode('utf-8')
+    except UnicodeDecodeError:
+        # Undeclared (or unknown) charset that isn't UTF-8 is almost always
+        # Latin-1 / Windows-1252 mail
+        return raw.decode('latin-1')
 
-async def list_folders(context: Context) -> List[Dict[str, Any]]:
+
+def _fetch_batched(client: IMAPClient, message_ids: List[int], items: List[Any]) -> Dict[int, Dict[Any, Any]]:
+    """FETCH ``items`` for ``message_ids`` in batches of config.FETCH_BATCH_SIZE.
+
+    Some servers reject overly long FETCH commands; batching also lets a big
+    response arrive in pieces rather than as one blob.
     """
-    List all email folders/mailboxes.
+    size = max(1, config.FETCH_BATCH_SIZE)
+    if len(message_ids) <= size:
+        return client.fetch(message_ids, items)
+    response: Dict[int, Dict[Any, Any]] = {}
+    for start in range(0, len(message_ids), size):
+        response.update(client.fetch(message_ids[start:start + size], items))
+    return response
+
+
+def _fetch_text_sections(
+    client: IMAPClient,
+    response: Dict[int, Dict[Any, Any]],
+    full_html: bool
+) -> Tuple[Dict[int, Tuple[Any, Any]], Dict[int, Dict[Any, Any]]]:
+    """Fetch the raw text parts located via BODYSTRUCTURE.
+
+    Attachments are never downloaded. Messages whose text parts sit at the
+    same sections share one FETCH.
+
+    Args:
+        client: IMAP client with the folder selected
+        response: FETCH response that includes BODYSTRUCTURE
+        full_html: Also fetch the first text/html part
 
     Returns:
-        List of folders with name and flags
+        The wanted (plain, html) parts per message ID and the FETCH response
+        holding their raw contents, for _decode_text_bodies()
+    """
+    wanted = {}
+    groups: Dict[Tuple[str, ...], List[int]] = {}
+    for msg_id, data in response.items():
+        plain = html = None
+        structure = data.get(b'BODYSTRUCTURE')
+        if structure:
+            for part in _text_parts(structure):
+                if part[1] == 'plain' and plain is None:
+                    plain = part
+                elif part[1] == 'html' and html is None and full_html:
+                    html = part
+        wanted[msg_id] = (plain, html)
+        sections = tuple(part[0] for part in (plain, html) if part)
+        if sections:
+            groups.setdefault(sections, []).append(msg_id)
+
+    fetched: Dict[int, Dict[Any, Any]] = {}
+    for sections, msg_ids in groups.items():
+        fetched.update(_fetch_batched(client, msg_ids, [f'BODY.PEEK[{section}]' for section in sections]))
+    return wanted, fetched
+
+
+def _decode_text_bodies(
+    wanted: Dict[int, Tuple[Any, Any]],
+    fetched: Dict[int, Dict[Any, Any]]
+) -> Dict[int, Tuple[str, str]]:
+    """Decode the text parts returned by _fetch_text_sections().
+
+    Returns:
+        (body_text, body_html) per message ID
+    """
+    bodies = {}
+    for msg_id, parts in wanted.items():
+        data = fetched.get(msg_id, {})
+        decoded = []
+        for part in parts:
+            if part is None:
+                decoded.append("")
+            else:
+                section, _, encoding, charset = part
+                decoded.append(_decode_part(data.get(f'BODY[{section}]'.encode()), encoding, charset))
+        bodies[msg_id] = (decoded[0], decoded[1])
+    return bodies
+
+
+def _fetch_text_bodies(
+    client: IMAPClient,
+    response: Dict[int, Dict[Any, Any]],
+    full_html: bool
+) -> Dict[int, Tuple[str, str]]:
+    """Fetch and decode only the text parts located via BODYSTRUCTURE.
+
+    Returns:
+        (body_text, body_html) per message ID
+    """
+    return _decode_text_bodies(*_fetch_text_sections(client, response, full_html))
+
+
+def _cached_body(
+    client: IMAPClient,
+    folder: str,
+    response: Dict[int, Dict[Any, Any]],
+    msg_id: int,
+    full_html: bool
+) -> Tuple[str, str]:
+    """Return one message's decoded text parts, from _BODY_CACHE when possible.
+
+    Args:
+        client: IMAP client with the folder selected
+        folder: Selected folder
+        response: FETCH response with BODYSTRUCTURE and INTERNALDATE
+        msg_id: Message UID
+        full_html: Also return the first text/html part
+
+    Returns:
+        (body_text, body_html)
     """
+    key = (getattr(client, '_pool_key', None), folder, msg_id,
+           response[msg_id].get(b'INTERNALDATE'), full_html)
+    with _BODY_CACHE_LOCK:
+        body = _BODY_CACHE.pop(key, None)
+    if body is None:
+        body = _fetch_text_bodies(client, {msg_id: response[msg_id]}, full_html)[msg_id]
+    with _BODY_CACHE_LOCK:
+        _BODY_CACHE[key] = body
+        while len(_BODY_CACHE) > _BODY_CACHE_SIZE:
+            del _BODY_CACHE[next(iter(_BODY_CACHE))]
+    return body
+
+
+def _prefetched(fetch: Callable[[Any], Any], batches: List[Any]) -> Iterator[Any]:
+    """Yield fetch(batch) for each batch, running the next fetch while the caller works.
+
+    The fetches run one at a time on a single worker thread, so an IMAP
+    connection used by ``fetch`` is never shared; only the caller's decoding
+    overlaps with the network wait for the following batch.
+    """
+    if len(batches) < 2:
+        for batch in batches:
+            yield fetch(batch)
+        return
+    with ThreadPoolExecutor(max_workers=1) as worker:
+        pending = worker.submit(fetch, batches[0])
+        for batch in batches[1:]:
+            result = pending.result()
+            pending = worker.submit(fetch, batch)
+            yield result
+        yield pending.result()
+
+
+def _fetch_envelopes(client: IMAPClient, message_ids: List[int]) -> Dict[int, Dict[Any, Any]]:
+    """FETCH FLAGS and ENVELOPE for listing messages.
+
+    ENVELOPE comes pre-parsed from the server, so listings skip header
+    parsing entirely. Dates are kept in their own UTC offset rather than
+    normalised to local time, so they format back like the Date header.
+    """
+    normalise_times = client.normalise_times
+    client.normalise_times = False
     try:
-        username, password = require_auth()
+        return _fetch_batched(client, message_ids, [b'FLAGS', b'ENVELOPE'])
+    finally:
+        client.normalise_times = normalise_times
 
-        client = _get_imap_client(username, password)
 
-        folders = client.list_folders()
+def _format_addresses(addresses: Any) -> str:
+    """Format ENVELOPE addresses like the original header ("Name <box@host>").
 
-        result = []
-        for flags, delimiter, name in folders:
-            result.append({
-                "name": name,
-                "flags": [flag.decode() if isinstance(flag, bytes) else flag for flag in flags],
-                "delimiter": delimiter
-            })
+    Group syntax (RFC 3501 §7.4.2) arrives as a NIL-host entry carrying the
+    group name, the members, then an all-NIL entry; it is rendered back as
+    "group: members;" (e.g. "undisclosed-recipients:;").
+    """
+    if not addresses:
+        return ""
+    formatted = []
+    group_name = None
+    members: List[str] = []
+    for address in addresses:
+        if address.host is None:
+            if address.mailbox is not None:
+                group_name = address.mailbox.decode('utf-8', errors='replace')
+                members = []
+            elif group_name is not None:
+                formatted.append(f"{group_name}: {', '.join(members)};" if members else f"{group_name}:;")
+                group_name = None
+            continue
+        mailbox = address.mailbox.decode('utf-8', errors='replace') if address.mailbox else ''
+        host = address.host.decode('utf-8', errors='replace')
+        bare = f"{mailbox}@{host}" if mailbox else host
+        name = _decode_mime_header(address.name.decode('utf-8', errors='replace')) if address.name else ''
+        if name:
+            if _ADDRESS_SPECIALS_RE.search(name):
+                name = '"' + name.replace('\\', '\\\\').replace('"', '\\"') + '"'
+            bare = f"{name} <{bare}>"
+        (members if group_name is not None else formatted).append(bare)
+    if group_name is not None:
+        # Unterminated group: keep what was listed
+        formatted.append(f"{group_name}: {', '.join(members)};" if members else f"{group_name}:;")
+    return ", ".join(formatted)
+
+
+def _envelope_summary(msg_id: int, data: Dict[Any, Any], folder: str) -> Optional[Dict[str, Any]]:
+    """Build a message listing entry from a FLAGS + ENVELOPE fetch item."""
+    envelope = data.get(b'ENVELOPE')
+    if envelope is None:
+        return None
+    try:
+        subject = envelope.subject.decode('utf-8', errors='replace') if envelope.subject else ''
+        return {
+            "id": str(msg_id),
+            "subject": _decode_mime_header(subject),
+            "from": _format_addresses(envelope.from_),
+            "to": _format_addresses(envelope.to),
+            "date": format_datetime(envelope.date) if envelope.date else '',
+            "flags": _message_flags(data),
+            "folder": folder
+        }
+    except (AttributeError, TypeError, ValueError) as _e:
+        return None
 
-        return result
-    except Exception as _e:
-        raise
+
+def _envelope_cache(client: IMAPClient, folder: str, folder_info: Dict[Any, Any]) -> Optional[Dict[int, Dict[str, Any]]]:
+    """Return the cached listing entries for the selected folder, if it can be cached.
+
+    Entries are keyed by UID under (account, folder, UIDVALIDITY); a new
+    UIDVALIDITY means the server renumbered the folder, so old entries are
+    never consulted again.
+    """
+    uidvalidity = folder_info.get(b'UIDVALIDITY')
+    pool_key = getattr(client, '_pool_key', None)
+    if uidvalidity is None or pool_key is None:
+        return None
+    with _ENVELOPE_CACHE_LOCK:
+        cache = _ENVELOPE_CACHE.pop((pool_key, folder, uidvalidity), None)
+        if cache is None:
+            # Forget older UIDVALIDITY generations of this folder
+            for key in [k for k in _ENVELOPE_CACHE if k[:2] == (pool_key, folder)]:
+                del _ENVELOPE_CACHE[key]
+            cache = {}
+        # Reinsert so the most recently listed folders are evicted last
+        _ENVELOPE_CACHE[(pool_key, folder, uidvalidity)] = cache
+        while len(_ENVELOPE_CACHE) > _ENVELOPE_CACHE_FOLDERS:
+            del _ENVELOPE_CACHE[next(iter(_ENVELOPE_CACHE))]
+    return cache
+
+
+def _summarize_messages(
+    client: IMAPClient,
+    message_ids: List[int],
+    folder: str,
+    folder_info: Dict[Any, Any]
+) -> List[Dict[str, Any]]:
+    """Fetch listing entries for messages in the selected folder, in ``message_ids`` order.
+
+    Shared by list_messages and both search_messages paths so they all run
+    on the caller's connection and selected folder. Messages listed before
+    only have their FLAGS fetched; ENVELOPE is fetched for the rest.
+    """
+    if not message_ids:
+        return []
+    cache = _envelope_cache(client, folder, folder_info)
+    with _ENVELOPE_CACHE_LOCK:
+        cached = {msg_id: cache[msg_id] for msg_id in message_ids if msg_id in cache} if cache is not None else {}
+
+    response: Dict[int, Dict[Any, Any]] = {}
+    if cached:
+        response.update(_fetch_batched(client, list(cached), [b'FLAGS']))
+    missing = [msg_id for msg_id in message_ids if msg_id not in cached]
+    if missing:
+        response.update(_fetch_envelopes(client, missing))
+
+    result = []
+    new_entries = {}
+    for msg_id in message_ids:
+        data = response.get(msg_id)
+        if data is None:
+            continue
+        if msg_id in cached:
+            summary = dict(cached[msg_id], flags=_message_flags(data))
+        else:
+            summary = _envelope_summary(msg_id, data, folder)
+            if summary is None:
+                continue
+            new_entries[msg_id] = dict(summary)
+        result.append(summary)
+
+    if cache is not None and new_entries:
+        with _ENVELOPE_CACHE_LOCK:
+            cache.update(new_entries)
+            # Entries are immutable per UID; drop the oldest beyond the cap
+            for msg_id in list(cache)[:max(0, len(cache) - _ENVELOPE_CACHE_SIZE)]:
+                del cache[msg_id]
+    return result
+
+
+def _select_folder(client: IMAPClient, folder: str, readonly: bool = False) -> Dict[Any, Any]:
+    """SELECT (or, read-only, EXAMINE) a folder and remember it on the connection.
+
+    Every folder selection goes through here (or _ensure_selected), so a
+    pooled connection always knows which folder it has open.
+    """
+    client._selected_folder = None
+    folder_info = client.select_folder(folder, readonly=readonly)
+    client._selected_folder = (folder, readonly)
+    return folder_info
+
+
+def _ensure_selected(client: IMAPClient, folder: str, readonly: bool = False) -> None:
+    """Select a folder unless this pooled connection already has it open the same way.
+
+    Saves a SELECT round trip for tools that don't need its response (message
+    counts etc.); the server keeps a selected folder up to date by itself.
+    """
+    if getattr(client, '_selected_folder', None) == (folder, readonly) and client._imap.state == 'SELECTED':
+        return
+    _select_folder(client, folder, readonly)
+
+
+@contextlib.contextmanager
+def _imap_session(
+    folder: Optional[str] = None,
+    readonly: bool = False,
+    auth: Optional[Tuple[str, str]] = None
+) -> Iterator[IMAPClient]:
+    """Check out a pooled IMAP client for the current user, optionally with a folder selected.
+
+    Args:
+        folder: Folder to select (via _ensure_selected) before yielding
+        readonly: Select the folder read-only (EXAMINE)
+        auth: (username, password) to use instead of the request's credentials
+
+    The client is checked back in on exit, or closed if the body failed at
+    the connection level.
+    """
+    username, password = auth or require_auth()
+    client = _get_imap_client(username, password)
+    try:
+        if folder is not None:
+            _ensure_selected(client, folder, readonly)
+        yield client
     finally:
-        try:
-            _close_imap_client(client)
-        except Exception as _e:
-            pass
+        _close_imap_client(client)
+
+
+def _search_newest(client: IMAPClient, folder_info: Dict[Any, Any], count: int) -> List[int]:
+    """Return the UIDs of the newest ``count`` messages in the selected folder.
+
+    Searches only the tail of the message sequence range (``n:*``), so the
+    server returns at most ``count`` UIDs instead of every UID in the folder.
+
+    Args:
+        client: IMAP client with the folder selected
+        folder_info: Response of select_folder() (provides EXISTS)
+        count: Number of messages wanted
+
+    Returns:
+        UIDs in ascending order
+    """
+    exists = folder_info.get(b'EXISTS', 0)
+    if not exists:
+        return []
+    first = max(1, exists - count + 1)
+    # A bare sequence set in UID SEARCH still means sequence numbers
+    return client.search([f'{first}:*'])
+
+
+def _note_folder_used(client: IMAPClient, folder: str) -> None:
+    """Drop the account's cached folder list if ``folder`` isn't in it."""
+    key = getattr(client, '_pool_key', None)
+    with _FOLDER_CACHE_LOCK:
+        cached = _FOLDER_CACHE.get(key)
+        if cached is not None and all(f["name"] != folder for f in cached[1]):
+            del _FOLDER_CACHE[key]
 
 
-async def list_messages(
+@_blocking_tool
+def list_folders(context: Context) -> List[Dict[str, Any]]:
+    """
+    List all email folders/mailboxes.
+
+    Returns:
+        List of folders with name and flags
+    """
+    username, password = require_auth()
+    key = _imap_key(username, password)
+    now = time.monotonic()
+    with _FOLDER_CACHE_LOCK:
+        cached = _FOLDER_CACHE.get(key)
+    if cached is not None and now - cached[0] < config.FOLDER_CACHE_TTL:
+        return cached[1]
+
+    with _imap_session(auth=(username, password)) as client:
+        result = [
+            {
+                "name": name,
+                "flags": list(map(_decode_flag, flags)),
+                "delimiter": delimiter
+            }
+            for flags, delimiter, name in client.list_folders()
+        ]
+    with _FOLDER_CACHE_LOCK:
+        _FOLDER_CACHE[key] = (now, result)
+    return result
+
+
+@_blocking_tool
+def list_messages(
     context: Context,
     folder: str = "INBOX",
     limit: int = 50,
@@ -122,68 +845,24 @@ async def list_messages(
 
     Returns:
     """
-    try:
-        username, password = require_auth()
-
-        client = _get_imap_client(username, password)
-
-        client.select_folder(folder)
+    with _imap_session() as client:
+        folder_info = _select_folder(client, folder, readonly=True)
 
         # Search for messages
         if unread_only:
             messages = client.search(['UNSEEN'])
         else:
-            messages = client.search(['ALL'])
-
+            messages = _search_newest(client, folder_info, limit)
 
         # Get most recent messages
         message_ids = list(messages)[-limit:] if len(messages) > limit else list(messages)
         message_ids.reverse()  # Most recent first
 
-        if not message_ids:
-            return []
-
         # Fetch headers only - body is available via get_message()
-        response = client.fetch(message_ids, [b'FLAGS', b'BODY.PEEK[HEADER]'])
-
-        result = []
-        for msg_id, data in response.items():
-            try:
-                # Get header data
-                raw_header = None
-                for key in [b'BODY[HEADER]', 'BODY[HEADER]']:
-                    if key in data:
-                        raw_header = data[key]
-                        break
-
-                if raw_header is None:
-                    continue
+        return _summarize_messages(client, message_ids, folder, folder_info)
 
-                msg = email.message_from_bytes(raw_header)
-
-                result.append({
-                    "id": str(msg_id),
-                    "subject": _decode_mime_header(msg.get('Subject', '')),
-                    "from": _decode_mime_header(msg.get('From', '')),
-                    "to": _decode_mime_header(msg.get('To', '')),
-                    "date": msg.get('Date', ''),
-                    "flags": [flag.decode() if isinstance(flag, bytes) else flag for flag in data.get(b'FLAGS', data.get('FLAGS', []))],
-                    "folder": folder
-                })
-            except Exception as _e:
-                continue
-
-        return result
-
-    except Exception as _e:
-        raise
-    finally:
-        try:
-            _close_imap_client(client)
-        except Exception as _e:
-            pass
-
-async def get_message(
+@_blocking_tool
+def get_message(
     context: Context,
     message_id: str,
     folder: str = "INBOX",
@@ -202,35 +881,29 @@ async def get_message(
     Returns:
         Complete message details
     """
-    try:
-        username, password = require_auth()
-        client = _get_imap_client(username, password)
-
-        client.select_folder(folder)
-
+    with _imap_session(folder, readonly=True) as client:
         msg_id = int(message_id)
 
-        # Use BODY.PEEK[] instead of RFC822 - more reliable with IMAPClient
-        response = client.fetch([msg_id], [b'FLAGS', b'BODY.PEEK[]'])
+        # Headers and (for the body) the MIME structure only; the text parts
+        # are fetched separately so attachments are never downloaded.
+        # INTERNALDATE identifies the message in the body cache.
+        items = [b'FLAGS', _MESSAGE_HEADER_FIELDS]
+        if include_body:
+            items.extend([b'BODYSTRUCTURE', b'INTERNALDATE'])
+        response = client.fetch([msg_id], items)
 
         if msg_id not in response:
             raise ValueError(f"Message {message_id} not found")
 
         data = response[msg_id]
 
-        # Try multiple possible keys for the message body
-        raw_email = None
-        for key in [b'BODY[]', 'BODY[]', b'RFC822', 'RFC822', b'BODY.PEEK[]']:
-            if key in data:
-                raw_email = data[key]
-                break
-
-        if raw_email is None:
+        raw_header = _header_bytes(data)
+        if raw_header is None:
             # Log available keys for debugging
             available_keys = list(data.keys())
-            raise KeyError(f"Message body not found. Available keys: {available_keys}")
+            raise KeyError(f"Message headers not found. Available keys: {available_keys}")
 
-        msg = email.message_from_bytes(raw_email)
+        msg = email.message_from_bytes(raw_header)
 
         result = {
             "id": message_id,
@@ -239,101 +912,60 @@ async def get_message(
             "to": _decode_mime_header(msg.get('To', '')),
             "cc": _decode_mime_header(msg.get('Cc', '')),
             "date": msg.get('Date', ''),
-            "flags": [flag.decode() if isinstance(flag, bytes) else flag for flag in data.get(b'FLAGS', data.get('FLAGS', []))],
+            "flags": _message_flags(data),
             "folder": folder
         }
 
         if include_body:
-            # Extract body
-            body_text = ""
-            body_html = ""
-
-            if msg.is_multipart():
-                for part in msg.walk():
-                    content_type = part.get_content_type()
-                    if content_type == "text/plain":
-                        try:
-                            body_text = part.get_payload(decode=True).decode('utf-8', errors='ignore')
-                        except Exception as _e:
-                            pass
-                    elif content_type == "text/html" and full_html:
-                        try:
-                            body_html = part.get_payload(decode=True).decode('utf-8', errors='ignore')
-                        except Exception as _e:
-                            pass
-            else:
-                try:
-                    body_text = msg.get_payload(decode=True).decode('utf-8', errors='ignore')
-                except Exception as _e:
-                    pass
-
+            body_text, body_html = _cached_body(client, folder, response, msg_id, full_html)
             result["body_text"] = body_text
             if full_html:
                 result["body_html"] = body_html
 
         return result
 
-    except Exception as _e:
-        raise
-    finally:
-        try:
-            _close_imap_client(client)
-        except Exception as _e:
-            pass
-
 
-async def get_messages(
-    context: Context,
-    message_ids: List[str],
-    folder: str = "INBOX",
-    include_body: bool = True,
-    full_html: bool = False
+def _get_messages_on_client(
+    client: IMAPClient,
+    folder: str,
+    msg_ids: List[int],
+    include_body: bool,
+    full_html: bool
 ) -> List[Dict[str, Any]]:
-    """
-    Get multiple messages at once.
-
-    Args:
-        message_ids: List of message IDs to fetch
-        folder: Folder name (default: INBOX)
-        include_body: Include message body content
-        full_html: Include full HTML body (default: False, only text body returned)
-
-    Returns:
-        List of message details
-    """
-    try:
-        username, password = require_auth()
-        client = _get_imap_client(username, password)
+    """Fetch get_messages() details for ``msg_ids`` on a client with ``folder`` selected."""
+    # Fetch headers (and MIME structure), then the text parts
+    items = [b'FLAGS', _MESSAGE_HEADER_FIELDS]
+    if include_body:
+        items.append(b'BODYSTRUCTURE')
 
-        client.select_folder(folder)
+    def fetch_batch(batch):
+        response = client.fetch(batch, items)
+        sections = _fetch_text_sections(client, response, full_html) if include_body else None
+        return batch, response, sections
 
-        # Convert string IDs to integers
-        msg_ids = [int(mid) for mid in message_ids]
+    # Batches are fetched one ahead, so decoding a batch overlaps with
+    # the network round trips of the next one
+    size = max(1, config.FETCH_BATCH_SIZE)
+    batches = [msg_ids[start:start + size] for start in range(0, len(msg_ids), size)]
 
-        # Fetch all messages at once
-        response = client.fetch(msg_ids, [b'FLAGS', b'BODY.PEEK[]'])
+    results = []
 
-        results = []
+    for batch, response, sections in _prefetched(fetch_batch, batches):
+        bodies = _decode_text_bodies(*sections) if include_body else {}
 
-        for msg_id in msg_ids:
+        for msg_id in batch:
             if msg_id not in response:
                 # Skip missing messages
                 continue
 
             data = response[msg_id]
 
-            # Try multiple possible keys for the message body
-            raw_email = None
-            for key in [b'BODY[]', 'BODY[]', b'RFC822', 'RFC822', b'BODY.PEEK[]']:
-                if key in data:
-                    raw_email = data[key]
-                    break
-
-            if raw_email is None:
-                # Skip messages without body
+            raw_header = _header_bytes(data)
+            if raw_header is None:
+                # Skip messages without headers
                 continue
 
-            msg = email.message_from_bytes(raw_email)
+            msg = email.message_from_bytes(raw_header)
 
             result = {
                 "id": str(msg_id),
@@ -342,182 +974,330 @@ async def get_messages(
                 "to": _decode_mime_header(msg.get('To', '')),
                 "cc": _decode_mime_header(msg.get('Cc', '')),
                 "date": msg.get('Date', ''),
-                "flags": [flag.decode() if isinstance(flag, bytes) else flag for flag in data.get(b'FLAGS', data.get('FLAGS', []))],
+                "flags": _message_flags(data),
                 "folder": folder
             }
 
             if include_body:
-                # Extract body
-                body_text = ""
-                body_html = ""
-
-                if msg.is_multipart():
-                    for part in msg.walk():
-                        content_type = part.get_content_type()
-                        if content_type == "text/plain":
-                            try:
-                                body_text = part.get_payload(decode=True).decode('utf-8', errors='ignore')
-                            except Exception as _e:
-                                pass
-                        elif content_type == "text/html" and full_html:
-                            try:
-                                body_html = part.get_payload(decode=True).decode('utf-8', errors='ignore')
-                            except Exception as _e:
-                                pass
-                else:
-                    try:
-                        body_text = msg.get_payload(decode=True).decode('utf-8', errors='ignore')
-                    except Exception as _e:
-                        pass
-
+                body_text, body_html = bodies.get(msg_id, ("", ""))
                 result["body_text"] = body_text
                 if full_html:
                     result["body_html"] = body_html
 
             results.append(result)
 
-        return results
+    return results
+
+
+def _get_messages_on_connection(
+    username: str,
+    password: str,
+    folder: str,
+    msg_ids: List[int],
+    include_body: bool,
+    full_html: bool
+) -> List[Dict[str, Any]]:
+    """Run _get_messages_on_client() on a pooled connection of its own."""
+    with _imap_session(folder, readonly=True, auth=(username, password)) as client:
+        return _get_messages_on_client(client, folder, msg_ids, include_body, full_html)
 
-    except Exception as _e:
-        raise
-    finally:
-        try:
-            _close_imap_client(client)
-        except Exception as _e:
-            pass
 
-async def search_messages(
+@_blocking_tool
+def get_messages(
     context: Context,
-    query: str,
+    message_ids: List[str],
     folder: str = "INBOX",
-    limit: int = 50
+    include_body: bool = True,
+    full_html: bool = False
 ) -> List[Dict[str, Any]]:
     """
-    Search for messages by text query.
+    Get multiple messages at once.
 
     Args:
-        query: Search text (searches subject and from fields)
+        message_ids: List of message IDs to fetch
         folder: Folder name (default: INBOX)
-        limit: Maximum number of results
+        include_body: Include message body content
+        full_html: Include full HTML body (default: False, only text body returned)
 
     Returns:
-        List of matching messages
+        List of message details
     """
     username, password = require_auth()
-    client = _get_imap_client(username, password)
 
-    try:
-        client.select_folder(folder)
+    # Convert string IDs to integers
+    msg_ids = [int(mid) for mid in message_ids]
+
+    fetch = functools.partial(
+        _get_messages_on_connection, username, password, folder,
+        include_body=include_body, full_html=full_html
+    )
+
+    # Large requests are split into contiguous stripes fetched in parallel,
+    # one pooled connection each (capped at the pool size, far below
+    # iCloud's per-account connection limit)
+    stripes = min(_IMAP_POOL_SIZE, len(msg_ids) // _MESSAGES_PER_CONNECTION)
+    if stripes < 2:
+        return fetch(msg_ids)
+
+    size = -(-len(msg_ids) // stripes)
+    chunks = [msg_ids[start:start + size] for start in range(0, len(msg_ids), size)]
+    with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+        return [result for part in pool.map(fetch, chunks) for result in part]
+
+
+@_blocking_tool
+def get_messages_by_folder(
+    context: Context,
+    groups: Dict[str, List[str]],
+    include_body: bool = True,
+    full_html: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Get messages from several folders at once.
+
+    Args:
+        groups: Message IDs to fetch, keyed by folder name
+        include_body: Include message body content
+        full_html: Include full HTML body (default: False, only text body returned)
+
+    Returns:
+        List of message details, grouped in the order of ``groups``
+    """
+    username, password = require_auth()
+
+    def fetch(folder: str) -> List[Dict[str, Any]]:
+        msg_ids = [int(mid) for mid in groups[folder]]
+        return _get_messages_on_connection(
+            username, password, folder, msg_ids,
+            include_body=include_body, full_html=full_html
+        )
+
+    # Each folder is selected and fetched on a pooled connection of its own,
+    # so the folders' round trips overlap instead of running back to back
+    folders = [folder for folder, message_ids in groups.items() if message_ids]
+    if len(folders) < 2:
+        return [result for folder in folders for result in fetch(folder)]
+    with ThreadPoolExecutor(max_workers=min(_IMAP_POOL_SIZE, len(folders))) as pool:
+        return [result for part in pool.map(fetch, folders) for result in part]
+
 
-        # Try server-side search with UTF-8 charset (RFC 2978)
-        # This works with modern IMAP servers including iCloud
+def _search_on_client(
+    client: IMAPClient,
+    query: str,
+    folder: str,
+    limit: int,
+    since: Optional[date] = None
+) -> List[Dict[str, Any]]:
+    """Run search_messages() on a checked-out client."""
+    folder_info = _select_folder(client, folder, readonly=True)
+
+    # Server-side search. ASCII queries need no CHARSET; others are sent
+    # as UTF-8 unless this connection's server already refused that.
+    criteria = ['OR', ['SUBJECT', query], ['FROM', query]]
+    if since is not None:
+        criteria.extend(['SINCE', since])
+    messages = None
+    if query.isascii():
+        messages = client.search(criteria)
+    elif not getattr(client, '_utf8_search_rejected', False):
         try:
-            # Search by subject or from using UTF-8 charset
-            messages = client.search(
-                ['OR', ['SUBJECT', query], ['FROM', query]],
-                charset='UTF-8'
-            )
-
-            message_ids = list(messages)[-limit:] if len(messages) > limit else list(messages)
-            message_ids.reverse()
-
-            if not message_ids:
-                return []
-
-            # Fetch headers only - body is available via get_message()
-            response = client.fetch(message_ids, [b'FLAGS', b'BODY.PEEK[HEADER]'])
-
-            result = []
-            for msg_id, data in response.items():
-                try:
-                    raw_header = None
-                    for key in [b'BODY[HEADER]', 'BODY[HEADER]']:
-                        if key in data:
-                            raw_header = data[key]
-                            break
-
-                    if raw_header is None:
-                        continue
+            messages = client.search(criteria, charset='UTF-8')
+        except _IMAP_BROKEN_ERRORS:
+            raise
+        except IMAPClient.Error as charset_error:
+            logger.error("Server-side UTF-8 search failed: %s. Falling back to local filtering.", charset_error)
+            client._utf8_search_rejected = True
+
+    if messages is not None:
+        message_ids = list(messages)[-limit:] if len(messages) > limit else list(messages)
+        message_ids.reverse()
 
-                    msg = email.message_from_bytes(raw_header)
-
-                    result.append({
-                        "id": str(msg_id),
-                        "subject": _decode_mime_header(msg.get('Subject', '')),
-                        "from": _decode_mime_header(msg.get('From', '')),
-                        "to": _decode_mime_header(msg.get('To', '')),
-                        "date": msg.get('Date', ''),
-                        "flags": [flag.decode() if isinstance(flag, bytes) else flag for flag in data.get(b'FLAGS', data.get('FLAGS', []))],
-                        "folder": folder
-                    })
-                except Exception as _e:
-                    continue
-
-            return result
-
-        except Exception as charset_error:
-            # Fallback: If CHARSET UTF-8 is not supported by server,
-            # fall back to local filtering (less efficient but always works)
-            logger.error(f"Server-side UTF-8 search failed: {charset_error}. Falling back to local filtering.")
-
-            # Fetch more messages to search through locally
-            fetch_limit = max(limit * 10, 200)
-
-            # Get all message IDs
-            all_msg_ids = client.search(['ALL'])
-            message_ids = list(all_msg_ids)[-fetch_limit:] if len(all_msg_ids) > fetch_limit else list(all_msg_ids)
-            message_ids.reverse()
-
-            if not message_ids:
-                return []
-
-            # Fetch headers only for local filtering
-            response = client.fetch(message_ids, [b'FLAGS', b'BODY.PEEK[HEADER]'])
-
-            all_messages = []
-            for msg_id, data in response.items():
-                try:
-                    raw_header = None
-                    for key in [b'BODY[HEADER]', 'BODY[HEADER]']:
-                        if key in data:
-                            raw_header = data[key]
-                            break
-
-                    if raw_header is None:
-                        continue
+        # Fetch headers only - body is available via get_message()
+        return _summarize_messages(client, message_ids, folder, folder_info)
+
+    # Fallback: If CHARSET UTF-8 is not supported by server,
+    # fall back to local filtering (less efficient but always works)
+
+    # Fetch more messages to search through locally
+    fetch_limit = max(limit * 10, 200)
+
+    # Get the newest message IDs (SINCE alone is plain ASCII, so the
+    # server can still apply the date bound)
+    if since is not None:
+        all_msg_ids = client.search(['SINCE', since])
+    else:
+        all_msg_ids = _search_newest(client, folder_info, fetch_limit)
+    message_ids = list(all_msg_ids)[-fetch_limit:] if len(all_msg_ids) > fetch_limit else list(all_msg_ids)
+    message_ids.reverse()
+
+    # Fetch headers only for local filtering, on the connection and
+    # folder selection the failed search already set up
+    all_messages = _summarize_messages(client, message_ids, folder, folder_info)
+
+    # Filter messages locally (supports any Unicode)
+    query_lower = query.lower()
+    filtered_messages = [
+        msg for msg in all_messages
+        if query_lower in msg.get("subject", "").lower()
+        or query_lower in msg.get("from", "").lower()
+        or query_lower in msg.get("to", "").lower()
+    ]
+
+    return filtered_messages[:limit]
+
+
+def _invalidate_searches(client: IMAPClient, *folders: str) -> None:
+    """Drop the account's cached search results for folders a tool just changed."""
+    _drop_searches(getattr(client, '_pool_key', None), folders)
 
-                    msg = email.message_from_bytes(raw_header)
-
-                    all_messages.append({
-                        "id": str(msg_id),
-                        "subject": _decode_mime_header(msg.get('Subject', '')),
-                        "from": _decode_mime_header(msg.get('From', '')),
-                        "to": _decode_mime_header(msg.get('To', '')),
-                        "date": msg.get('Date', ''),
-                        "flags": [flag.decode() if isinstance(flag, bytes) else flag for flag in data.get(b'FLAGS', data.get('FLAGS', []))],
-                        "folder": folder
-                    })
-                except Exception as _e:
-                    continue
-
-            # Filter messages locally (supports any Unicode)
-            query_lower = query.lower()
-            filtered_messages = [
-                msg for msg in all_messages
-                if query_lower in msg.get("subject", "").lower()
-                or query_lower in msg.get("from", "").lower()
-                or query_lower in msg.get("to", "").lower()
-            ]
-
-            return filtered_messages[:limit]
 
+def _drop_searches(key: Any, folders: Tuple[str, ...]) -> None:
+    """Drop cached search results of an account (pool key) for some folders."""
+    with _SEARCH_CACHE_LOCK:
+        for cache_key in [k for k in _SEARCH_CACHE if k[0] == key and k[1] in folders]:
+            del _SEARCH_CACHE[cache_key]
+
+
+def _idle_changed(responses: List[Tuple[Any, ...]]) -> bool:
+    """Whether IDLE responses report new, expunged or re-flagged messages."""
+    return any(len(response) > 1 and response[1] in _IDLE_CHANGES for response in responses)
+
+
+def _idle_watch(username: str, password: str, folder: str, state: Dict[str, Any]) -> None:
+    """Watch a folder with IMAP IDLE until it has gone unsearched for _IDLE_LINGER.
+
+    Runs on a daemon thread with a dedicated (unpooled) connection. Any error
+    just ends the watch; cached searches then fall back to SEARCH_CACHE_TTL.
+    """
+    key = _imap_key(username, password)
+    client = None
+    try:
+        client = IMAPClient(config.IMAP_SERVER, port=config.IMAP_PORT, ssl=True, use_uid=True)
+        client.login(username, password)
+        if not client.has_capability('IDLE'):
+            _IDLE_UNSUPPORTED.add(key)
+            return
+        client.select_folder(folder, readonly=True)
+
+        while time.monotonic() - state['last_used'] < _IDLE_LINGER:
+            client.idle()
+            state['armed'] = time.monotonic()
+            rearm_at = state['armed'] + _IDLE_REARM
+            while time.monotonic() < rearm_at and time.monotonic() - state['last_used'] < _IDLE_LINGER:
+                if _idle_changed(client.idle_check(timeout=30)):
+                    state['changed'] = time.monotonic()
+                    _drop_searches(key, (folder,))
+            # Changes between DONE and the next IDLE aren't watched, so
+            # results cached before re-arming revert to the TTL
+            state['armed'] = None
+            if _idle_changed(client.idle_done()[1]):
+                state['changed'] = time.monotonic()
+                _drop_searches(key, (folder,))
+    except Exception as e:
+        logger.error("IDLE watch of %s stopped: %s", folder, e)
+        with _IDLE_WATCHERS_LOCK:
+            _IDLE_FAILED[(key, folder)] = time.monotonic()
     finally:
-        try:
-            _close_imap_client(client)
-        except Exception as _e:
-            pass
+        state['armed'] = None
+        with _IDLE_WATCHERS_LOCK:
+            _IDLE_WATCHERS.pop((key, folder), None)
+        if client is not None:
+            _shutdown_imap_client(client)
+
+
+def _watch_folder(username: str, password: str, folder: str) -> None:
+    """Start an IDLE watcher for a folder with cached searches, or keep one alive."""
+    if not config.IMAP_IDLE:
+        return
+    key = _imap_key(username, password)
+    now = time.monotonic()
+    with _IDLE_WATCHERS_LOCK:
+        state = _IDLE_WATCHERS.get((key, folder))
+        if state is not None:
+            state['last_used'] = now
+            return
+        watched = sum(1 for watch_key, _ in _IDLE_WATCHERS if watch_key == key)
+        if key in _IDLE_UNSUPPORTED or watched >= _IDLE_MAX_FOLDERS:
+            return
+        if now - _IDLE_FAILED.get((key, folder), float('-inf')) < _IDLE_RETRY_AFTER:
+            return
+        _IDLE_FAILED.pop((key, folder), None)
+        state = {'armed': None, 'changed': 0.0, 'last_used': time.monotonic()}
+        _IDLE_WATCHERS[(key, folder)] = state
+    threading.Thread(
+        target=_idle_watch,
+        args=(username, password, folder, state),
+        name=f"imap-idle-{folder}",
+        daemon=True,
+    ).start()
+
+
+def _idle_fresh(key: Any, folder: str, searched_at: float) -> bool:
+    """Whether IDLE has watched the folder, unchanged, since ``searched_at``."""
+    with _IDLE_WATCHERS_LOCK:
+        state = _IDLE_WATCHERS.get((key, folder))
+    if state is None:
+        return False
+    armed = state['armed']
+    return armed is not None and armed <= searched_at and state['changed'] < searched_at
+
+
+@_blocking_tool
+def search_messages(
+    context: Context,
+    query: str,
+    folder: str = "INBOX",
+    limit: int = 50,
+    since: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Search for messages by text query.
+
+    Args:
+        query: Search text (searches subject and from fields)
+        folder: Folder name (default: INBOX)
+        limit: Maximum number of results
+        since: Only messages received on or after this date (YYYY-MM-DD)
 
-async def send_message(
+    Returns:
+        List of matching messages
+    """
+    since_date = date.fromisoformat(since) if since else None
+
+    # Repeated and refined searches are common; serve identical ones from a
+    # short-lived cache that the mutating tools invalidate per folder
+    username, password = require_auth()
+    cache_key = (_imap_key(username, password), folder, query.lower(), limit, since_date)
+    now = time.monotonic()
+    with _SEARCH_CACHE_LOCK:
+        cached = _SEARCH_CACHE.get(cache_key)
+    if cached is not None and (
+        now - cached[0] < config.SEARCH_CACHE_TTL or _idle_fresh(cache_key[0], folder, cached[0])
+    ):
+        _watch_folder(username, password, folder)
+        return cached[1]
+
+    with _imap_session(auth=(username, password)) as client:
+        result = _search_on_client(client, query, folder, limit, since_date)
+
+    with _SEARCH_CACHE_LOCK:
+        _SEARCH_CACHE.pop(cache_key, None)
+        _SEARCH_CACHE[cache_key] = (now, result)
+        while len(_SEARCH_CACHE) > _SEARCH_CACHE_SIZE:
+            del _SEARCH_CACHE[next(iter(_SEARCH_CACHE))]
+    _watch_folder(username, password, folder)
+    return result
+
+
+def _split_addresses(value: Optional[str]) -> List[str]:
+    """Split a comma-separated recipient list, dropping surrounding whitespace and empty entries."""
+    if not value:
+        return []
+    return [addr for addr in _ADDRESS_SPLIT_RE.split(value.strip()) if addr]
+
+
+@_blocking_tool
+def send_message(
     context: Context,
     to: str,
     subject: str,
@@ -558,51 +1338,44 @@ async def send_message(
         msg.attach(MIMEText(body, 'html'))
 
     # Send via SMTP
-    with _get_smtp_client(username, password) as client:
-        recipients = [to]
-        if cc:
-            recipients.extend([addr.strip() for addr in cc.split(',')])
-        if bcc:
-            recipients.extend([addr.strip() for addr in bcc.split(',')])
+    client = _get_smtp_client(username, password)
+    try:
+        recipients = [to, *_split_addresses(cc), *_split_addresses(bcc)]
 
         client.send_message(msg, from_addr=username, to_addrs=recipients)
+    finally:
+        _close_smtp_client(client)
 
     # Save copy to Sent folder via IMAP
-    imap_client = None
     try:
-        imap_client = _get_imap_client(username, password)
+        with _imap_session(auth=(username, password)) as imap_client:
+            # Add Date header if not present
+            if 'Date' not in msg:
+                from email.utils import formatdate
+                msg['Date'] = formatdate(localtime=True)
 
-        # Add Date header if not present
-        if 'Date' not in msg:
-            from email.utils import formatdate
-            msg['Date'] = formatdate(localtime=True)
+            # Append message to Sent folder
+            # Convert message to bytes
+            msg_bytes = msg.as_bytes()
 
-        # Append message to Sent folder
-        # Convert message to bytes
-        msg_bytes = msg.as_bytes()
-
-        # Try to append to Sent folder
-        try:
-            imap_client.append(config.SENT_FOLDER, msg_bytes, flags=['\\Seen'])
-        except Exception as e:
-            # If Sent Messages folder doesn't exist, try common alternatives
-            for folder_name in ['Sent', 'Sent Items', config.SENT_FOLDER]:
-                try:
-                    imap_client.append(folder_name, msg_bytes, flags=['\\Seen'])
-                    break
-                except Exception:
-                    continue
-            else:
-                # Log error but don't fail the send operation
-                logger.error(f"Could not save to Sent folder: {e}")
+            # Try to append to Sent folder
+            try:
+                imap_client.append(config.SENT_FOLDER, msg_bytes, flags=['\\Seen'])
+            except Exception as e:
+                # If Sent Messages folder doesn't exist, try common alternatives
+                for folder_name in ['Sent', 'Sent Items', config.SENT_FOLDER]:
+                    try:
+                        imap_client.append(folder_name, msg_bytes, flags=['\\Seen'])
+                        break
+                    except Exception:
+                        continue
+                else:
+                    # Log error but don't fail the send operation
+                    logger.error("Could not save to Sent folder: %s", e)
 
     except Exception as e:
         # Log error but don't fail the send operation
-        logger.error(f"Error saving to Sent folder: {e}")
-
-    finally:
-        if imap_client:
-            _close_imap_client(imap_client)
+        logger.error("Error saving to Sent folder: %s", e)
 
     return {
         "status": "success",
@@ -610,7 +1383,40 @@ async def send_message(
     }
 
 
-async def move_message(
+def _expunge_messages(client: IMAPClient, msg_ids: List[int]) -> None:
+    """Flag messages \\Deleted and expunge them.
+
+    With UIDPLUS (RFC 4315) only these messages are expunged; a plain EXPUNGE
+    would also remove anything else already flagged in the folder. The STORE
+    is silent, so the server doesn't echo the updated flags back.
+    """
+    client.delete_messages(msg_ids, silent=True)
+    if client.has_capability('UIDPLUS'):
+        client.uid_expunge(msg_ids)
+    else:
+        client.expunge()
+
+
+def _move_to_folder(client: IMAPClient, msg_ids: List[int], folder: str) -> None:
+    """Move messages out of the selected folder.
+
+    Uses a single MOVE (RFC 6851) when the server supports it, otherwise
+    COPY followed by flagging and expunging the originals.
+    """
+    if client.has_capability('MOVE'):
+        client.move(msg_ids, folder)
+    else:
+        client.copy(msg_ids, folder)
+        _expunge_messages(client, msg_ids)
+
+
+def _message_uids(message_ids: List[str]) -> List[int]:
+    """Convert tool-supplied message IDs to UIDs, dropping duplicates."""
+    return list(dict.fromkeys(int(message_id) for message_id in message_ids))
+
+
+@_blocking_tool
+def move_message(
     context: Context,
     message_id: str,
     from_folder: str,
@@ -627,32 +1433,48 @@ async def move_message(
     Returns:
         Confirmation message
     """
-    username, password = require_auth()
-
-    client = _get_imap_client(username, password)
-    
-    try:
-        client.select_folder(from_folder)
+    with _imap_session(from_folder) as client:
         msg_id = int(message_id)
 
-        # Copy to destination
-        client.copy([msg_id], to_folder)
-
-        # Delete from source
-        client.delete_messages([msg_id])
-        client.expunge()
+        _move_to_folder(client, [msg_id], to_folder)
+        _invalidate_searches(client, from_folder, to_folder)
+        # A folder created elsewhere since the last listing: list afresh
+        _note_folder_used(client, to_folder)
 
         return {
             "status": "success",
             "message": f"Message {message_id} moved from {from_folder} to {to_folder}"
         }
-    finally:
-        try:
-            _close_imap_client(client)
-        except Exception as _e:
-            pass
 
-async def delete_message(
+
+def _delete(message_ids: List[str], folder: str, permanent: bool) -> str:
+    """Delete messages from one folder in a single round of commands.
+
+    Returns:
+        Description of what was done, for the confirmation message
+    """
+    with _imap_session(folder) as client:
+        msg_ids = _message_uids(message_ids)
+
+        if permanent:
+            # Permanent deletion
+            _expunge_messages(client, msg_ids)
+            outcome = "permanently deleted"
+        else:
+            # Move to Trash
+            try:
+                _move_to_folder(client, msg_ids, 'Trash')
+                outcome = "moved to Trash"
+            except Exception as _e:
+                # Fallback to permanent delete if Trash doesn't exist
+                _expunge_messages(client, msg_ids)
+                outcome = "deleted"
+        _invalidate_searches(client, folder, 'Trash')
+
+        return outcome
+
+@_blocking_tool
+def delete_message(
     context: Context,
     message_id: str,
     folder: str = "INBOX",
@@ -669,43 +1491,55 @@ async def delete_message(
     Returns:
         Confirmation message
     """
-    username, password = require_auth()
+    outcome = _delete([message_id], folder, permanent)
 
-    client = _get_imap_client(username, password)
-    
-    try:
-        client.select_folder(folder)
-        msg_id = int(message_id)
+    return {
+        "status": "success",
+        "message": f"Message {message_id} {outcome}"
+    }
 
-        if permanent:
-            # Permanent deletion
-            client.delete_messages([msg_id])
-            client.expunge()
-            message = f"Message {message_id} permanently deleted"
-        else:
-            # Move to Trash
-            try:
-                client.copy([msg_id], 'Trash')
-                client.delete_messages([msg_id])
-                client.expunge()
-                message = f"Message {message_id} moved to Trash"
-            except Exception as _e:
-                # Fallback to permanent delete if Trash doesn't exist
-                client.delete_messages([msg_id])
-                client.expunge()
-                message = f"Message {message_id} deleted"
 
-        return {
-            "status": "success",
-            "message": message
-        }
-    finally:
-        try:
-            _close_imap_client(client)
-        except Exception as _e:
-            pass
+@_blocking_tool
+def delete_messages(
+    context: Context,
+    message_ids: List[str],
+    folder: str = "INBOX",
+    permanent: bool = False
+) -> Dict[str, str]:
+    """
+    Delete several messages from one folder at once.
+
+    Args:
+        message_ids: Message IDs
+        folder: Folder name (default: INBOX)
+        permanent: Permanently delete (True) or move to trash (False)
+
+    Returns:
+        Confirmation message
+    """
+    if not message_ids:
+        return {"status": "success", "message": "No messages to delete"}
+
+    outcome = _delete(message_ids, folder, permanent)
+
+    return {
+        "status": "success",
+        "message": f"{len(set(message_ids))} messages {outcome}"
+    }
+
 
-async def mark_as_read(
+def _set_seen(message_ids: List[str], folder: str, seen: bool) -> None:
+    """Add or remove \\Seen on messages with one silent UID STORE."""
+    with _imap_session(folder) as client:
+        msg_ids = _message_uids(message_ids)
+        if seen:
+            client.add_flags(msg_ids, ['\\Seen'], silent=True)
+        else:
+            client.remove_flags(msg_ids, ['\\Seen'], silent=True)
+        _invalidate_searches(client, folder)
+
+@_blocking_tool
+def mark_as_read(
     context: Context,
     message_id: str,
     folder: str = "INBOX"
@@ -720,26 +1554,15 @@ async def mark_as_read(
     Returns:
         Confirmation message
     """
-    username, password = require_auth()
+    _set_seen([message_id], folder, True)
 
-    client = _get_imap_client(username, password)
-    
-    try:
-        client.select_folder(folder)
-        msg_id = int(message_id)
-        client.add_flags([msg_id], ['\\Seen'])
-
-        return {
-            "status": "success",
-            "message": f"Message {message_id} marked as read"
-        }
-    finally:
-        try:
-            _close_imap_client(client)
-        except Exception as _e:
-            pass
+    return {
+        "status": "success",
+        "message": f"Message {message_id} marked as read"
+    }
 
-async def mark_as_unread(
+@_blocking_tool
+def mark_as_unread(
     context: Context,
     message_id: str,
     folder: str = "INBOX"
@@ -754,21 +1577,59 @@ async def mark_as_unread(
     Returns:
         Confirmation message
     """
-    username, password = require_auth()
+    _set_seen([message_id], folder, False)
 
-    client = _get_imap_client(username, password)
-    
-    try:
-        client.select_folder(folder)
-        msg_id = int(message_id)
-        client.remove_flags([msg_id], ['\\Seen'])
+    return {
+        "status": "success",
+        "message": f"Message {message_id} marked as unread"
+    }
 
-        return {
-            "status": "success",
-            "message": f"Message {message_id} marked as unread"
-        }
-    finally:
-        try:
-            _close_imap_client(client)
-        except Exception as _e:
-            pass
+
+@_blocking_tool
+def mark_messages_read(
+    context: Context,
+    message_ids: List[str],
+    folder: str = "INBOX"
+) -> Dict[str, str]:
+    """
+    Mark several messages in one folder as read.
+
+    Args:
+        message_ids: Message IDs
+        folder: Folder name (default: INBOX)
+
+    Returns:
+        Confirmation message
+    """
+    if message_ids:
+        _set_seen(message_ids, folder, True)
+
+    return {
+        "status": "success",
+        "message": f"{len(set(message_ids))} messages marked as read"
+    }
+
+
+@_blocking_tool
+def mark_messages_unread(
+    context: Context,
+    message_ids: List[str],
+    folder: str = "INBOX"
+) -> Dict[str, str]:
+    """
+    Mark several messages in one folder as unread.
+
+    Args:
+        message_ids: Message IDs
+        folder: Folder name (default: INBOX)
+
+    Returns:
+        Confirmation message
+    """
+    if message_ids:
+        _set_seen(message_ids, folder, False)
+
+    return {
+        "status": "success",
+        "message": f"{len(set(message_ids))} messages marked as unread"
+    }
@@ -3,41 +3,53 @@
 Apple Reminders are VTODO components served over the same CalDAV endpoint as
 calendar events. Reminder lists are CalDAV collections whose supported component
 set includes ``VTODO``. This module mirrors the patterns in ``calendar.py``:
-a shared stateless client, strict iCloud-friendly iCal formatting on create, and
-a per-host client + raw PUT for update/delete to avoid parent-dependency issues.
+a shared cached client, strict iCloud-friendly iCal formatting on create, and
+raw absolute-URL GET/PUT/DELETE on that client for update/delete to avoid
+parent-dependency issues.
 """
 
-import caldav
+import uuid
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
-from urllib.parse import urlparse
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 from mcp.server.fastmcp import Context
-from .auth import require_auth
-from .calendar import _get_caldav_client
+from .calendar import _ICAL_ESCAPE, _account_client, _cached_calendars, _fold, _ical_iso
 
+if TYPE_CHECKING:
+    import caldav
 
-def _supports_todo(calendar: caldav.Calendar) -> bool:
+
+# VTODO support per collection URL. A collection's supported component set is
+# fixed when it is created, so each one costs a PROPFIND only once.
+_TODO_SUPPORT: Dict[str, bool] = {}
+
+
+def _supports_todo(calendar: "caldav.Calendar") -> bool:
     """Return True if a calendar collection advertises VTODO support."""
+    url = str(calendar.url)
+    supported = _TODO_SUPPORT.get(url)
+    if supported is not None:
+        return supported
+
     try:
-        return "VTODO" in (calendar.get_supported_components() or [])
+        supported = "VTODO" in (calendar.get_supported_components() or [])
     except Exception:
-        # Some collections don't advertise the component set; treat as non-todo.
+        # Some collections don't advertise the component set; treat as non-todo
+        # (not cached, the PROPFIND may just have failed).
         return False
+    _TODO_SUPPORT[url] = supported
+    return supported
 
 
-def _reminder_calendars(principal: caldav.Principal) -> List[caldav.Calendar]:
+def _reminder_calendars(client: "caldav.DAVClient") -> List["caldav.Calendar"]:
     """Return only the calendars that hold reminders (VTODO collections)."""
-    return [cal for cal in principal.calendars() if _supports_todo(cal)]
+    # Reuses calendar.py's TTL-cached collection list instead of a PROPFIND
+    all_calendars, _ = _cached_calendars(client)
+    return [cal for cal in all_calendars if _supports_todo(cal)]
 
 
 def _escape(text: str) -> str:
     """Escape special characters for an iCalendar text value."""
-    return (
-        text.replace("\\", "\\\\")
-        .replace(",", "\\,")
-        .replace(";", "\\;")
-        .replace("\n", "\\n")
-    )
+    return text.translate(_ICAL_ESCAPE)
 
 
 def _format_due(due: str) -> str:
@@ -59,16 +71,42 @@ def _iso(value: Any) -> Optional[str]:
     return str(value)
 
 
-def _serialize_todo(todo: caldav.CalendarObjectResource, list_name: str = "") -> Dict[str, Any]:
+def _serialize_todo(todo: "caldav.CalendarObjectResource", list_name: str = "") -> Dict[str, Any]:
     """Convert a loaded Todo resource into a plain dict."""
-    vtodo = todo.vobject_instance.vtodo
-    status = str(vtodo.status.value) if hasattr(vtodo, "status") and vtodo.status else "NEEDS-ACTION"
+    # get_todos() sorts its results by DUE/PRIORITY, which makes caldav parse
+    # each one with icalendar; reading that component avoids a second vobject
+    # parse. vobject remains the fallback for data icalendar rejects.
+    try:
+        vtodo = todo.icalendar_component
+    except Exception:
+        vtodo = None
+
+    if vtodo is not None and vtodo.name == "VTODO":
+        status = str(vtodo.get("STATUS") or "NEEDS-ACTION")
+        title = str(vtodo.get("SUMMARY", ""))
+        notes = str(vtodo.get("DESCRIPTION", ""))
+        due = _ical_iso(vtodo.get("DUE"))
+        raw_priority = vtodo.get("PRIORITY")
+        priority = int(raw_priority) if raw_priority is not None else None
+    else:
+        vtodo = todo.vobject_instance.vtodo
+        status_prop = getattr(vtodo, "status", None)
+        summary_prop = getattr(vtodo, "summary", None)
+        description_prop = getattr(vtodo, "description", None)
+        due_prop = getattr(vtodo, "due", None)
+        priority_prop = getattr(vtodo, "priority", None)
+        status = str(status_prop.value) if status_prop else "NEEDS-ACTION"
+        title = str(summary_prop.value) if summary_prop else ""
+        notes = str(description_prop.value) if description_prop else ""
+        due = _iso(due_prop.value) if due_prop else None
+        priority = int(priority_prop.value) if priority_prop else None
+
     return {
         "id": str(todo.url),
-        "title": str(vtodo.summary.value) if hasattr(vtodo, "summary") and vtodo.summary else "",
-        "notes": str(vtodo.description.value) if hasattr(vtodo, "description") and vtodo.description else "",
-        "due": _iso(vtodo.due.value) if hasattr(vtodo, "due") and vtodo.due else None,
-        "priority": int(vtodo.priority.value) if hasattr(vtodo, "priority") and vtodo.priority else None,
+        "title": title,
+        "notes": notes,
+        "due": due,
+        "priority": priority,
         "status": status,
         "completed": status == "COMPLETED",
         "list": list_name,
@@ -83,12 +121,10 @@ async def list_reminder_lists(context: Context) -> List[Dict[str, Any]]:
     Returns:
         List of reminder lists with id, name, and url
     """
-    email, password = require_auth()
-    client = _get_caldav_client(email, password)
-    principal = client.principal()
+    _, _, client = _account_client()
 
     result = []
-    for cal in _reminder_calendars(principal):
+    for cal in _reminder_calendars(client):
         result.append({
             "id": str(cal.url),
             "name": cal.name or "Unnamed List",
@@ -112,14 +148,14 @@ async def list_reminders(
     Returns:
         List of reminders with details
     """
-    email, password = require_auth()
-    client = _get_caldav_client(email, password)
-    principal = client.principal()
+    _, _, client = _account_client()
 
     if list_id:
+        import caldav
+
         lists_to_search = [caldav.Calendar(client=client, url=list_id)]
     else:
-        lists_to_search = _reminder_calendars(principal)
+        lists_to_search = _reminder_calendars(client)
 
     result = []
     for cal in lists_to_search:
@@ -159,40 +195,44 @@ async def create_reminder(
     Returns:
         Created reminder details
     """
-    email, password = require_auth()
-    client = _get_caldav_client(email, password)
-    principal = client.principal()
+    _, _, client = _account_client()
 
     if list_id:
+        import caldav
+
         calendar = caldav.Calendar(client=client, url=list_id)
     else:
-        reminder_lists = _reminder_calendars(principal)
+        reminder_lists = _reminder_calendars(client)
         if not reminder_lists:
             raise ValueError("No reminder lists found (no VTODO-capable collections)")
         calendar = reminder_lists[0]
 
     now = datetime.now(timezone.utc)
-    # UID without dots (iCloud compatible), matching calendar.py
-    uid = f"{int(now.timestamp())}{now.microsecond}@icloud-mcp"
-
-    ical_data = (
-        "BEGIN:VCALENDAR\n"
-        "VERSION:2.0\n"
-        "PRODID:-//iCloud MCP//EN\n"
-        "CALSCALE:GREGORIAN\n"
-        "BEGIN:VTODO\n"
-        f"UID:{uid}\n"
-        f"DTSTAMP:{now.strftime('%Y%m%dT%H%M%SZ')}\n"
-        f"SUMMARY:{_escape(title)}\n"
-        "STATUS:NEEDS-ACTION\n"
-    )
+    # Random UID without dots (iCloud compatible), matching calendar.py; a
+    # timestamp-based UID collides when two reminders land in the same microsecond
+    uid = f"{uuid.uuid4().hex}@icloud-mcp"
+
+    # CRLF line endings and 75-octet folding, as in calendar.create_event
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//iCloud MCP//EN",
+        "CALSCALE:GREGORIAN",
+        "BEGIN:VTODO",
+        f"UID:{uid}",
+        f"DTSTAMP:{now.strftime('%Y%m%dT%H%M%SZ')}",
+        f"SUMMARY:{_escape(title)}",
+        "STATUS:NEEDS-ACTION",
+    ]
     if due:
-        ical_data += _format_due(due) + "\n"
+        lines.append(_format_due(due))
     if notes:
-        ical_data += f"DESCRIPTION:{_escape(notes)}\n"
+        lines.append(f"DESCRIPTION:{_escape(notes)}")
     if priority is not None:
-        ical_data += f"PRIORITY:{int(priority)}\n"
-    ical_data += "END:VTODO\nEND:VCALENDAR"
+        lines.append(f"PRIORITY:{int(priority)}")
+    lines.append("END:VTODO")
+    lines.append("END:VCALENDAR")
+    ical_data = "\r\n".join(_fold(line) for line in lines) + "\r\n"
 
     try:
         todo = calendar.add_todo(ical_data)
@@ -212,25 +252,29 @@ async def create_reminder(
     }
 
 
-def _load_todo(email: str, password: str, reminder_id: str):
-    """Load a Todo using a client bound to the reminder's own host.
+def _load_todo(client: "caldav.DAVClient", reminder_id: str) -> "caldav.Todo":
+    """Load a Todo through the account's cached client.
 
-    iCloud serves objects from per-shard hosts (e.g. p72-caldav.icloud.com);
-    a client built from the object URL avoids URL-join errors, matching the
-    approach in calendar.update_event / delete_event.
+    iCloud serves objects from per-shard hosts (e.g. p72-caldav.icloud.com).
+    DAVClient.request() sends the absolute URL as-is, so the pooled session
+    reaches that host directly; only caldav's object wrappers would try to
+    join it onto client.url, matching calendar.update_event / delete_event.
     """
-    parsed = urlparse(reminder_id)
-    host_url = f"{parsed.scheme}://{parsed.netloc}"
-    host_client = caldav.DAVClient(url=host_url, username=email, password=password)
-    todo = caldav.Todo(client=host_client, url=reminder_id)
-    todo.load()
-    return host_client, todo
+    import caldav
+
+    response = client.request(reminder_id)
+    if response.status >= 400:
+        raise Exception(f"HTTP {response.status} {response.reason}")
+    # No client: the wrapper is only used to parse the returned data
+    return caldav.Todo(url=reminder_id, data=response.raw)
 
 
-def _put_todo(host_client: caldav.DAVClient, reminder_id: str, todo: caldav.Todo) -> None:
+def _put_todo(client: "caldav.DAVClient", reminder_id: str, todo: "caldav.Todo") -> None:
     """Serialize and PUT a modified todo directly (avoids parent dependency)."""
     updated_ical = todo.vobject_instance.serialize()
-    host_client.put(reminder_id, updated_ical, {"Content-Type": "text/calendar; charset=utf-8"})
+    response = client.put(reminder_id, updated_ical, {"Content-Type": "text/calendar; charset=utf-8"})
+    if response.status >= 400:
+        raise Exception(f"HTTP {response.status} {response.reason}")
 
 
 async def update_reminder(
@@ -256,18 +300,19 @@ async def update_reminder(
     Returns:
         Updated reminder details
     """
-    email, password = require_auth()
+    _, _, client = _account_client()
 
     try:
-        host_client, todo = _load_todo(email, password, reminder_id)
+        todo = _load_todo(client, reminder_id)
     except Exception as e:
         raise Exception(f"Error loading reminder: {str(e)}")
 
     vtodo = todo.vobject_instance.vtodo
 
     def _set(name: str, value: Any) -> None:
-        if hasattr(vtodo, name):
-            getattr(vtodo, name).value = value
+        prop = getattr(vtodo, name, None)
+        if prop is not None:
+            prop.value = value
         else:
             vtodo.add(name).value = value
 
@@ -279,8 +324,9 @@ async def update_reminder(
         _set("priority", str(int(priority)))
     if due is not None:
         # Remove any existing DUE so we can re-add with the right VALUE param
-        if hasattr(vtodo, "due"):
-            vtodo.remove(vtodo.due)
+        due_prop = getattr(vtodo, "due", None)
+        if due_prop is not None:
+            vtodo.remove(due_prop)
         if len(due) == 10:
             d = vtodo.add("due")
             d.value = datetime.fromisoformat(due).date()
@@ -297,11 +343,12 @@ async def update_reminder(
         else:
             _set("status", "NEEDS-ACTION")
             _set("percent-complete", "0")
-            if hasattr(vtodo, "completed"):
-                vtodo.remove(vtodo.completed)
+            completed_prop = getattr(vtodo, "completed", None)
+            if completed_prop is not None:
+                vtodo.remove(completed_prop)
 
     try:
-        _put_todo(host_client, reminder_id, todo)
+        _put_todo(client, reminder_id, todo)
     except Exception as e:
         raise Exception(f"Error saving reminder: {str(e)}")
 
@@ -331,13 +378,13 @@ async def delete_reminder(context: Context, reminder_id: str) -> Dict[str, str]:
     Returns:
         Confirmation message
     """
-    email, password = require_auth()
+    _, _, client = _account_client()
 
-    parsed = urlparse(reminder_id)
-    host_url = f"{parsed.scheme}://{parsed.netloc}"
-    host_client = caldav.DAVClient(url=host_url, username=email, password=password)
-    todo = caldav.Todo(client=host_client, url=reminder_id)
-    todo.delete()
+    # A single DELETE on the pooled session; 404 means it is already gone,
+    # same as caldav's own delete()
+    response = client.delete(reminder_id)
+    if response.status not in (200, 204, 404):
+        raise Exception(f"HTTP {response.status} {response.reason}")
 
     return {"status": "success", "message": f"Reminder {reminder_id} deleted"}
 
@@ -363,5 +410,5 @@ async def search_reminders(
     q = query.lower()
     return [
         r for r in reminders
-        if q in r.get("title", "").lower() or q in r.get("notes", "").lower()
+        if q in f'{r.get("title", "")}\x00{r.get("notes", "")}'.lower()
     ]
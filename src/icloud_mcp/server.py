@@ -9,6 +9,9 @@ OAuth 2.0 auth for Claude.ai connector; static bearer token for Claude Code.
 PIN gate on authorize step if MCP_AUTH_PIN is set.
 """
 
+import asyncio
+import functools
+import logging
 import os
 import sys
 
@@ -27,6 +30,8 @@ _use_sse = "--http" in sys.argv or os.environ.get("MCP_TRANSPORT") == "sse"
 # Module-level reference to the OAuth provider (needed by the PIN route handler)
 _oauth_provider = None
 
+logger = logging.getLogger(__name__)
+
 
 def _build_mcp() -> FastMCP:
     """Build the FastMCP instance with optional OAuth for SSE mode."""
@@ -81,6 +86,25 @@ def _build_mcp() -> FastMCP:
 mcp = _build_mcp()
 
 
+def _tool_errors(func):
+    """Turn exceptions raised by an MCP tool into error results.
+
+    Authentication failures become ``{"error", "status": 401}``; anything
+    else is logged with its traceback and reported as status 500.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        except AuthenticationError as e:
+            return {"error": str(e), "status": 401}
+        except Exception as e:
+            logger.error("Tool %s failed", func.__name__, exc_info=True)
+            return {"error": str(e), "status": 500}
+
+    return wrapper
+
+
 # ============================================================================
 # Health Check Endpoint
 # ============================================================================
@@ -272,7 +296,8 @@ async def smartfolders_run(request):
     })
 
     try:
-        result = smartfolders.run_search(params)
+        # IMAP search/fetch blocks; keep it off the event loop
+        result = await asyncio.to_thread(smartfolders.run_search, params)
     except AuthenticationError as e:
         return JSONResponse({"error": str(e)}, status_code=401)
     except Exception as e:
@@ -293,21 +318,18 @@ async def smartfolders_run(request):
 # ============================================================================
 
 @mcp.tool()
+@_tool_errors
 async def calendar_list_calendars(context) -> list | dict:
     """
     List all available calendars.
 
     Returns a list of calendars with their IDs, names, and URLs.
     """
-    try:
-        return await calendar.list_calendars(context)
-    except AuthenticationError as e:
-        return {"error": str(e), "status": 401}
-    except Exception as e:
-        return {"error": str(e), "status": 500}
+    return await calendar.list_calendars(context)
 
 
 @mcp.tool()
+@_tool_errors
 async def calendar_list_events(
     context,
     calendar_id: str = None,
@@ -322,15 +344,11 @@ async def calendar_list_events(
         start_date: Start date in ISO format YYYY-MM-DD (optional)
         end_date: End date in ISO format YYYY-MM-DD (optional)
     """
-    try:
-        return await calendar.list_events(context, calendar_id, start_date, end_date)
-    except AuthenticationError as e:
-        return {"error": str(e), "status": 401}
-    except Exception as e:
-        return {"error": str(e), "status": 500}
+    return await calendar.list_events(context, calendar_id, start_date, end_date)
 
 
 @mcp.tool()
+@_tool_errors
 async def calendar_create_event(
     context,
     summary: str,
@@ -353,15 +371,28 @@ async def calendar_create_event(
         attendees: List of attendee email addresses to invite (optional)
         calendar_id: Target calendar URL/ID (optional)
     """
-    try:
-        return await calendar.create_event(context, summary, start, end, description, location, attendees, calendar_id)
-    except AuthenticationError as e:
-        return {"error": str(e), "status": 401}
-    except Exception as e:
-        return {"error": str(e), "status": 500}
+    return await calendar.create_event(context, summary, start, end, description, location, attendees, calendar_id)
 
 
 @mcp.tool()
+@_tool_errors
+async def calendar_create_events_bulk(
+    context,
+    events: list[dict],
+    calendar_id: str = None
+) -> list | dict:
+    """
+    Create many calendar events at once (e.g. an import).
+
+    Args:
+        events: List of events, each with summary, start, end (ISO format) and optional description, location
+        calendar_id: Target calendar URL/ID (optional)
+    """
+    return await calendar.create_events_bulk(context, events, calendar_id)
+
+
+@mcp.tool()
+@_tool_errors
 async def calendar_update_event(
     context,
     event_id: str,
@@ -384,15 +415,11 @@ async def calendar_update_event(
         location: New location (optional)
         attendees: New list of attendee email addresses (optional, replaces existing)
     """
-    try:
-        return await calendar.update_event(context, event_id, summary, start, end, description, location, attendees)
-    except AuthenticationError as e:
-        return {"error": str(e), "status": 401}
-    except Exception as e:
-        return {"error": str(e), "status": 500}
+    return await calendar.update_event(context, event_id, summary, start, end, description, location, attendees)
 
 
 @mcp.tool()
+@_tool_errors
 async def calendar_delete_event(context, event_id: str) -> dict:
     """
     Delete a calendar event.
@@ -400,15 +427,11 @@ async def calendar_delete_event(context, event_id: str) -> dict:
     Args:
         event_id: Event URL/ID to delete
     """
-    try:
-        return await calendar.delete_event(context, event_id)
-    except AuthenticationError as e:
-        return {"error": str(e), "status": 401}
-    except Exception as e:
-        return {"error": str(e), "status": 500}
+    return await calendar.delete_event(context, event_id)
 
 
 @mcp.tool()
+@_tool_errors
 async def calendar_search_events(
     context,
     query: str,
@@ -425,12 +448,26 @@ async def calendar_search_events(
         start_date: Start date in ISO format (optional)
         end_date: End date in ISO format (optional)
     """
-    try:
-        return await calendar.search_events(context, query, calendar_id, start_date, end_date)
-    except AuthenticationError as e:
-        return {"error": str(e), "status": 401}
-    except Exception as e:
-        return {"error": str(e), "status": 500}
+    return await calendar.search_events(context, query, calendar_id, start_date, end_date)
+
+
+@mcp.tool()
+@_tool_errors
+async def calendar_get_busy_times(
+    context,
+    start_date: str = None,
+    end_date: str = None,
+    calendar_id: str = None
+) -> list | dict:
+    """
+    Get busy time periods (free/busy) without fetching full events.
+
+    Args:
+        start_date: Start date in ISO format (optional)
+        end_date: End date in ISO format (optional)
+        calendar_id: Specific calendar URL/ID (optional, defaults to all calendars)
+    """
+    return await calendar.get_busy_times(context, start_date, end_date, calendar_id)
 
 
 # ============================================================================
@@ -439,21 +476,18 @@ async def calendar_search_events(
 
 
 @mcp.tool()
+@_tool_errors
 async def reminders_list_lists(context) -> list | dict:
     """
     List all reminder lists (VTODO-capable CalDAV collections).
 
     Returns a list of reminder lists with their IDs, names, and URLs.
     """
-    try:
-        return await reminders.list_reminder_lists(context)
-    except AuthenticationError as e:
-        return {"error": str(e), "status": 401}
-    except Exception as e:
-        return {"error": str(e), "status": 500}
+    return await reminders.list_reminder_lists(context)
 
 
 @mcp.tool()
+@_tool_errors
 async def reminders_list(
     context,
     list_id: str = None,
@@ -466,15 +500,11 @@ async def reminders_list(
         list_id: Specific reminder list URL/ID (optional, defaults to all lists)
         include_completed: Include completed reminders (default: only pending)
     """
-    try:
-        return await reminders.list_reminders(context, list_id, include_completed)
-    except AuthenticationError as e:
-        return {"error": str(e), "status": 401}
-    except Exception as e:
-        return {"error": str(e), "status": 500}
+    return await reminders.list_reminders(context, list_id, include_completed)
 
 
 @mcp.tool()
+@_tool_errors
 async def reminders_create(
     context,
     title: str,
@@ -494,15 +524,11 @@ async def reminders_create(
         priority: Priority 1-9 (1=high, 5=medium, 9=low) (optional)
         list_id: Target reminder list URL/ID (optional, defaults to first list)
     """
-    try:
-        return await reminders.create_reminder(context, title, due, notes, priority, list_id)
-    except AuthenticationError as e:
-        return {"error": str(e), "status": 401}
-    except Exception as e:
-        return {"error": str(e), "status": 500}
+    return await reminders.create_reminder(context, title, due, notes, priority, list_id)
 
 
 @mcp.tool()
+@_tool_errors
 async def reminders_update(
     context,
     reminder_id: str,
@@ -523,15 +549,11 @@ async def reminders_update(
         priority: New priority 1-9 (optional)
         completed: Mark complete (True) or reopen (False) (optional)
     """
-    try:
-        return await reminders.update_reminder(context, reminder_id, title, due, notes, priority, completed)
-    except AuthenticationError as e:
-        return {"error": str(e), "status": 401}
-    except Exception as e:
-        return {"error": str(e), "status": 500}
+    return await reminders.update_reminder(context, reminder_id, title, due, notes, priority, completed)
 
 
 @mcp.tool()
+@_tool_errors
 async def reminders_complete(context, reminder_id: str) -> dict:
     """
     Mark a reminder as completed.
@@ -539,15 +561,11 @@ async def reminders_complete(context, reminder_id: str) -> dict:
     Args:
         reminder_id: Reminder URL/ID
     """
-    try:
-        return await reminders.complete_reminder(context, reminder_id)
-    except AuthenticationError as e:
-        return {"error": str(e), "status": 401}
-    except Exception as e:
-        return {"error": str(e), "status": 500}
+    return await reminders.complete_reminder(context, reminder_id)
 
 
 @mcp.tool()
+@_tool_errors
 async def reminders_delete(context, reminder_id: str) -> dict:
     """
     Delete a reminder.
@@ -555,15 +573,11 @@ async def reminders_delete(context, reminder_id: str) -> dict:
     Args:
         reminder_id: Reminder URL/ID to delete
     """
-    try:
-        return await reminders.delete_reminder(context, reminder_id)
-    except AuthenticationError as e:
-        return {"error": str(e), "status": 401}
-    except Exception as e:
-        return {"error": str(e), "status": 500}
+    return await reminders.delete_reminder(context, reminder_id)
 
 
 @mcp.tool()
+@_tool_errors
 async def reminders_search(
     context,
     query: str,
@@ -578,12 +592,7 @@ async def reminders_search(
         list_id: Specific reminder list URL/ID (optional)
         include_completed: Include completed reminders (default: only pending)
     """
-    try:
-        return await reminders.search_reminders(context, query, list_id, include_completed)
-    except AuthenticationError as e:
-        return {"error": str(e), "status": 401}
-    except Exception as e:
-        return {"error": str(e), "status": 500}
+    return await reminders.search_reminders(context, query, list_id, include_completed)
 
 
 # ============================================================================
@@ -591,6 +600,7 @@ async def reminders_search(
 # ============================================================================
 
 @mcp.tool()
+@_tool_errors
 async def contacts_list(context, limit: int = None) -> list | dict:
     """
     List all contacts.
@@ -598,15 +608,11 @@ async def contacts_list(context, limit: int = None) -> list | dict:
     Args:
         limit: Maximum number of contacts to return (optional)
     """
-    try:
-        return await contacts.list_contacts(context, limit)
-    except AuthenticationError as e:
-        return {"error": str(e), "status": 401}
-    except Exception as e:
-        return {"error": str(e), "status": 500}
+    return await contacts.list_contacts(context, limit)
 
 
 @mcp.tool()
+@_tool_errors
 async def contacts_get(context, contact_id: str) -> dict:
     """
     Get a specific contact by ID.
@@ -614,15 +620,11 @@ async def contacts_get(context, contact_id: str) -> dict:
     Args:
         contact_id: Contact URL/ID
     """
-    try:
-        return await contacts.get_contact(context, contact_id)
-    except AuthenticationError as e:
-        return {"error": str(e), "status": 401}
-    except Exception as e:
-        return {"error": str(e), "status": 500}
+    return await contacts.get_contact(context, contact_id)
 
 
 @mcp.tool()
+@_tool_errors
 async def contacts_create(
     context,
     name: str,
@@ -643,15 +645,11 @@ async def contacts_create(
         organization: Company/organization name (optional)
         title: Job title (optional)
     """
-    try:
-        return await contacts.create_contact(context, name, phones, emails, addresses, organization, title)
-    except AuthenticationError as e:
-        return {"error": str(e), "status": 401}
-    except Exception as e:
-        return {"error": str(e), "status": 500}
+    return await contacts.create_contact(context, name, phones, emails, addresses, organization, title)
 
 
 @mcp.tool()
+@_tool_errors
 async def contacts_update(
     context,
     contact_id: str,
@@ -674,15 +672,11 @@ async def contacts_update(
         organization: New company/organization (optional)
         title: New job title (optional)
     """
-    try:
-        return await contacts.update_contact(context, contact_id, name, phones, emails, addresses, organization, title)
-    except AuthenticationError as e:
-        return {"error": str(e), "status": 401}
-    except Exception as e:
-        return {"error": str(e), "status": 500}
+    return await contacts.update_contact(context, contact_id, name, phones, emails, addresses, organization, title)
 
 
 @mcp.tool()
+@_tool_errors
 async def contacts_delete(context, contact_id: str) -> dict:
     """
     Delete a contact.
@@ -690,15 +684,11 @@ async def contacts_delete(context, contact_id: str) -> dict:
     Args:
         contact_id: Contact URL/ID to delete
     """
-    try:
-        return await contacts.delete_contact(context, contact_id)
-    except AuthenticationError as e:
-        return {"error": str(e), "status": 401}
-    except Exception as e:
-        return {"error": str(e), "status": 500}
+    return await contacts.delete_contact(context, contact_id)
 
 
 @mcp.tool()
+@_tool_errors
 async def contacts_search(context, query: str) -> list | dict:
     """
     Search for contacts by text query.
@@ -706,12 +696,7 @@ async def contacts_search(context, query: str) -> list | dict:
     Args:
         query: Search text (matches name, email, phone)
     """
-    try:
-        return await contacts.search_contacts(context, query)
-    except AuthenticationError as e:
-        return {"error": str(e), "status": 401}
-    except Exception as e:
-        return {"error": str(e), "status": 500}
+    return await contacts.search_contacts(context, query)
 
 
 # ============================================================================
@@ -719,21 +704,18 @@ async def contacts_search(context, query: str) -> list | dict:
 # ============================================================================
 
 @mcp.tool()
+@_tool_errors
 async def email_list_folders(context) -> list | dict:
     """
     List all email folders/mailboxes.
 
     Returns a list of folders with their names and flags.
     """
-    try:
-        return await email_module.list_folders(context)
-    except AuthenticationError as e:
-        return {"error": str(e), "status": 401}
-    except Exception as e:
-        return {"error": str(e), "status": 500}
+    return await email_module.list_folders(context)
 
 
 @mcp.tool()
+@_tool_errors
 async def email_list_messages(
     context,
     folder: str = "INBOX",
@@ -750,15 +732,11 @@ async def email_list_messages(
 
     Note: The Sent folder may be named "Sent Messages", "Sent", or "Sent Items" depending on your email provider.
     """
-    try:
-        return await email_module.list_messages(context, folder, limit, unread_only)
-    except AuthenticationError as e:
-        return {"error": str(e), "status": 401}
-    except Exception as e:
-        return {"error": str(e), "status": 500}
+    return await email_module.list_messages(context, folder, limit, unread_only)
 
 
 @mcp.tool()
+@_tool_errors
 async def email_get_message(
     context,
     message_id: str,
@@ -775,15 +753,11 @@ async def email_get_message(
         include_body: Include message body content (default: True)
         full_html: Include full HTML body (default: False, only text body returned)
     """
-    try:
-        return await email_module.get_message(context, message_id, folder, include_body, full_html)
-    except AuthenticationError as e:
-        return {"error": str(e), "status": 401}
-    except Exception as e:
-        return {"error": str(e), "status": 500}
+    return await email_module.get_message(context, message_id, folder, include_body, full_html)
 
 
 @mcp.tool()
+@_tool_errors
 async def email_get_messages(
     context,
     message_ids: list[str],
@@ -800,20 +774,36 @@ async def email_get_messages(
         include_body: Include message body content (default: True)
         full_html: Include full HTML body (default: False, only text body returned)
     """
-    try:
-        return await email_module.get_messages(context, message_ids, folder, include_body, full_html)
-    except AuthenticationError as e:
-        return {"error": str(e), "status": 401}
-    except Exception as e:
-        return {"error": str(e), "status": 500}
+    return await email_module.get_messages(context, message_ids, folder, include_body, full_html)
 
 
 @mcp.tool()
+@_tool_errors
+async def email_get_messages_by_folder(
+    context,
+    groups: dict[str, list[str]],
+    include_body: bool = True,
+    full_html: bool = False
+) -> list | dict:
+    """
+    Get messages from several folders in one call, fetching the folders in parallel.
+
+    Args:
+        groups: Message IDs keyed by folder name, e.g. {"INBOX": ["12", "15"], "Archive": ["3"]}
+        include_body: Include message body content (default: True)
+        full_html: Include full HTML body (default: False)
+    """
+    return await email_module.get_messages_by_folder(context, groups, include_body, full_html)
+
+
+@mcp.tool()
+@_tool_errors
 async def email_search(
     context,
     query: str,
     folder: str = "INBOX",
-    limit: int = 50
+    limit: int = 50,
+    since: str = None
 ) -> list | dict:
     """
     Search for messages by text query.
@@ -822,16 +812,13 @@ async def email_search(
         query: Search text (searches subject and from fields)
         folder: Folder name (default: INBOX)
         limit: Maximum number of results (default: 50)
+        since: Only messages received on or after this date, YYYY-MM-DD (optional)
     """
-    try:
-        return await email_module.search_messages(context, query, folder, limit)
-    except AuthenticationError as e:
-        return {"error": str(e), "status": 401}
-    except Exception as e:
-        return {"error": str(e), "status": 500}
+    return await email_module.search_messages(context, query, folder, limit, since)
 
 
 @mcp.tool()
+@_tool_errors
 async def email_send(
     context,
     to: str,
@@ -852,15 +839,11 @@ async def email_send(
         bcc: BCC recipients (optional, comma-separated)
         html: Whether body is HTML (default: False)
     """
-    try:
-        return await email_module.send_message(context, to, subject, body, cc, bcc, html)
-    except AuthenticationError as e:
-        return {"error": str(e), "status": 401}
-    except Exception as e:
-        return {"error": str(e), "status": 500}
+    return await email_module.send_message(context, to, subject, body, cc, bcc, html)
 
 
 @mcp.tool()
+@_tool_errors
 async def email_move(
     context,
     message_id: str,
@@ -875,15 +858,11 @@ async def email_move(
         from_folder: Source folder
         to_folder: Destination folder
     """
-    try:
-        return await email_module.move_message(context, message_id, from_folder, to_folder)
-    except AuthenticationError as e:
-        return {"error": str(e), "status": 401}
-    except Exception as e:
-        return {"error": str(e), "status": 500}
+    return await email_module.move_message(context, message_id, from_folder, to_folder)
 
 
 @mcp.tool()
+@_tool_errors
 async def email_delete(
     context,
     message_id: str,
@@ -898,15 +877,11 @@ async def email_delete(
         folder: Folder name (default: INBOX)
         permanent: Permanently delete (True) or move to trash (False)
     """
-    try:
-        return await email_module.delete_message(context, message_id, folder, permanent)
-    except AuthenticationError as e:
-        return {"error": str(e), "status": 401}
-    except Exception as e:
-        return {"error": str(e), "status": 500}
+    return await email_module.delete_message(context, message_id, folder, permanent)
 
 
 @mcp.tool()
+@_tool_errors
 async def email_mark_read(
     context,
     message_id: str,
@@ -919,15 +894,11 @@ async def email_mark_read(
         message_id: Message ID
         folder: Folder name (default: INBOX)
     """
-    try:
-        return await email_module.mark_as_read(context, message_id, folder)
-    except AuthenticationError as e:
-        return {"error": str(e), "status": 401}
-    except Exception as e:
-        return {"error": str(e), "status": 500}
+    return await email_module.mark_as_read(context, message_id, folder)
 
 
 @mcp.tool()
+@_tool_errors
 async def email_mark_unread(
     context,
     message_id: str,
@@ -940,19 +911,77 @@ async def email_mark_unread(
         message_id: Message ID
         folder: Folder name (default: INBOX)
     """
-    try:
-        return await email_module.mark_as_unread(context, message_id, folder)
-    except AuthenticationError as e:
-        return {"error": str(e), "status": 401}
-    except Exception as e:
-        return {"error": str(e), "status": 500}
+    return await email_module.mark_as_unread(context, message_id, folder)
+
+
+@mcp.tool()
+@_tool_errors
+async def email_mark_read_bulk(
+    context,
+    message_ids: list[str],
+    folder: str = "INBOX"
+) -> dict:
+    """
+    Mark several messages in one folder as read.
+
+    Args:
+        message_ids: List of message IDs
+        folder: Folder name (default: INBOX)
+    """
+    return await email_module.mark_messages_read(context, message_ids, folder)
+
+
+@mcp.tool()
+@_tool_errors
+async def email_mark_unread_bulk(
+    context,
+    message_ids: list[str],
+    folder: str = "INBOX"
+) -> dict:
+    """
+    Mark several messages in one folder as unread.
+
+    Args:
+        message_ids: List of message IDs
+        folder: Folder name (default: INBOX)
+    """
+    return await email_module.mark_messages_unread(context, message_ids, folder)
+
+
+@mcp.tool()
+@_tool_errors
+async def email_delete_bulk(
+    context,
+    message_ids: list[str],
+    folder: str = "INBOX",
+    permanent: bool = False
+) -> dict:
+    """
+    Delete several messages from one folder.
+
+    Args:
+        message_ids: List of message IDs
+        folder: Folder name (default: INBOX)
+        permanent: Permanently delete (True) or move to trash (False)
+    """
+    return await email_module.delete_messages(context, message_ids, folder, permanent)
 
 
 # ============================================================================
 # Server Entrypoint
 # ============================================================================
 
+def _install_uvloop() -> None:
+    """Run the server on uvloop when it is installed (the ``uvloop`` extra)."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def main():
+    _install_uvloop()
     if _use_sse:
         mcp.run(transport="sse")
     else:
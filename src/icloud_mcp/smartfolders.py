@@ -21,19 +21,32 @@ import logging
 import os
 import sys
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
 from .auth import require_auth
-from .email import _close_imap_client, _decode_mime_header, _get_imap_client
+from .email import (
+    _decode_mime_header,
+    _ensure_selected,
+    _header_bytes,
+    _imap_session,
+    _message_flags,
+)
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.ERROR)
 
 DEFAULT_LIMIT = 25
 MAX_LIMIT = 100
+# Folders searched concurrently, each on its own IMAP connection
+MAX_PARALLEL_FOLDERS = 4
+
+# Headers the digest uses (Message-ID feeds the message:// deep links)
+_DIGEST_HEADER_FIELDS = b"BODY.PEEK[HEADER.FIELDS (SUBJECT FROM TO DATE MESSAGE-ID)]"
 
 
 def _digest_tz() -> ZoneInfo:
@@ -59,7 +72,7 @@ def get_presets() -> Dict[str, Dict[str, Any]]:
     try:
         parsed = json.loads(raw)
     except json.JSONDecodeError as e:
-        logger.error(f"SMARTFOLDERS env var is not valid JSON: {e}")
+        logger.error("SMARTFOLDERS env var is not valid JSON: %s", e)
         return {}
     return parsed if isinstance(parsed, dict) else {}
 
@@ -128,6 +141,57 @@ def _parse_message_date(msg: email.message.Message) -> datetime:
         return datetime.fromtimestamp(0, tz=timezone.utc)
 
 
+def _search_folder(username: str, password: str, folder: str,
+                   criteria: list, limit: int) -> Tuple[int, List[Dict[str, Any]]]:
+    """Search one folder on its own pooled connection.
+
+    Returns the folder's match count and digest entries for its newest
+    ``limit`` matches; a folder that can't be selected or searched counts
+    as empty.
+    """
+    collected: List[Dict[str, Any]] = []
+    with _imap_session(auth=(username, password)) as client:
+        try:
+            _ensure_selected(client, folder, readonly=True)
+            matched = client.search(criteria)
+        except Exception as e:
+            logger.error("Smart folder search failed in %s: %s", folder, e)
+            return 0, collected
+
+        # UID order approximates arrival order; take the newest per folder
+        recent_ids = list(matched)[-limit:]
+        if not recent_ids:
+            return len(matched), collected
+
+        response = client.fetch(recent_ids, [b"FLAGS", _DIGEST_HEADER_FIELDS])
+        for msg_id, data in response.items():
+            raw_header = _header_bytes(data)
+            if raw_header is None:
+                continue
+
+            msg = email.message_from_bytes(raw_header)
+            flags = _message_flags(data)
+            subject = _decode_mime_header(msg.get("Subject", ""))
+            sent = _parse_message_date(msg)
+            # message:// deep links resolve on iOS/macOS for messages Mail
+            # has synced on-device; unresolvable ones just open Mail.
+            mid = (msg.get("Message-ID") or "").strip()
+            collected.append({
+                "id": str(msg_id),
+                "folder": folder,
+                "subject": " ".join(subject.split()) or "(no subject)",
+                "from": " ".join(_decode_mime_header(msg.get("From", "")).split()),
+                "to": _decode_mime_header(msg.get("To", "")),
+                "date": sent.isoformat(),
+                "_sort": sent,
+                "unread": "\\Seen" not in flags,
+                "message_url": (
+                    "message://" + urllib.parse.quote(mid, safe="") if mid else ""
+                ),
+            })
+        return len(matched), collected
+
+
 def run_search(params: Dict[str, Any]) -> Dict[str, Any]:
     """Run a smart folder search and return counts, messages, and a text digest."""
     username, password = require_auth()
@@ -136,59 +200,19 @@ def run_search(params: Dict[str, Any]) -> Dict[str, Any]:
     limit = min(int(params.get("limit", DEFAULT_LIMIT)), MAX_LIMIT)
     criteria = _build_criteria(params)
 
-    collected: List[Dict[str, Any]] = []
-    total_matched = 0
-    client = None
-    try:
-        client = _get_imap_client(username, password)
-
-        for folder in folders:
-            try:
-                client.select_folder(folder, readonly=True)
-                matched = client.search(criteria)
-            except Exception as e:
-                logger.error(f"Smart folder search failed in {folder}: {e}")
-                continue
-
-            total_matched += len(matched)
-            # UID order approximates arrival order; take the newest per folder
-            recent_ids = list(matched)[-limit:]
-            if not recent_ids:
-                continue
-
-            response = client.fetch(recent_ids, [b"FLAGS", b"BODY.PEEK[HEADER]"])
-            for msg_id, data in response.items():
-                raw_header = None
-                for key in (b"BODY[HEADER]", "BODY[HEADER]"):
-                    if key in data:
-                        raw_header = data[key]
-                        break
-                if raw_header is None:
-                    continue
-
-                msg = email.message_from_bytes(raw_header)
-                flags = data.get(b"FLAGS", data.get("FLAGS", []))
-                flags = [f.decode() if isinstance(f, bytes) else f for f in flags]
-                subject = _decode_mime_header(msg.get("Subject", ""))
-                # message:// deep links resolve on iOS/macOS for messages Mail
-                # has synced on-device; unresolvable ones just open Mail.
-                mid = (msg.get("Message-ID") or "").strip()
-                collected.append({
-                    "id": str(msg_id),
-                    "folder": folder,
-                    "subject": " ".join(subject.split()) or "(no subject)",
-                    "from": " ".join(_decode_mime_header(msg.get("From", "")).split()),
-                    "to": _decode_mime_header(msg.get("To", "")),
-                    "date": _parse_message_date(msg).isoformat(),
-                    "_sort": _parse_message_date(msg),
-                    "unread": "\\Seen" not in flags,
-                    "message_url": (
-                        "message://" + urllib.parse.quote(mid, safe="") if mid else ""
-                    ),
-                })
-    finally:
-        if client is not None:
-            _close_imap_client(client)
+    search = partial(_search_folder, username, password, criteria=criteria, limit=limit)
+    if len(folders) == 1:
+        results = [search(folders[0])]
+    else:
+        # IMAP connections are single-threaded, so fan folders out over
+        # separate pooled connections, bounded well below iCloud's
+        # per-account connection cap
+        workers = min(len(folders), MAX_PARALLEL_FOLDERS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(search, folders))
+
+    total_matched = sum(count for count, _ in results)
+    collected = [m for _, messages in results for m in messages]
 
     collected.sort(key=lambda m: m["_sort"], reverse=True)
     collected = collected[:limit]
@@ -0,0 +1,18 @@
+"""Helpers shared by the tool modules."""
+
+import asyncio
+import functools
+
+
+def _blocking_tool(func):
+    """Turn a synchronous tool into a coroutine that runs in a worker thread.
+
+    imapclient, smtplib and requests block on their sockets. The whole chain
+    of round trips a tool makes (IMAP select/search/fetch, CardDAV
+    PROPFIND/REPORT/PUT, ...) runs in one to_thread call, so the event loop
+    stays free for other tool calls without a thread hop per request.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(func, *args, **kwargs)
+    return wrapper
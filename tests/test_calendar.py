@@ -0,0 +1,67 @@
+"""Tests for the calendar module's event search."""
+
+import asyncio
+
+from icloud_mcp import calendar
+
+
+class _Calendar:
+    """Calendar stand-in whose text-match REPORTs return or raise ``found``."""
+
+    def __init__(self, url, found):
+        self.url = url
+        self.found = found
+        self.searched = 0
+
+    def search(self, **kwargs):
+        self.searched += 1
+        if isinstance(self.found, Exception):
+            raise self.found
+        return self.found
+
+
+def _event(url, summary):
+    return {"url": url, "start": "2025-01-01T10:00:00", "summary": summary}
+
+
+def _patch(monkeypatch, calendars, listings):
+    listed = []
+
+    async def list_events(context, calendar_id=None, start_date=None, end_date=None):
+        listed.append(calendar_id)
+        return listings[calendar_id]
+
+    monkeypatch.setattr(calendar, "_account_client", lambda: (None, None, object()))
+    monkeypatch.setattr(calendar, "_calendars_to_search", lambda client, calendar_id: calendars)
+    monkeypatch.setattr(calendar, "_invalidate_calendars_on_error", lambda client, searches: None)
+    monkeypatch.setattr(calendar, "_events_to_dicts", lambda cal, events: list(events))
+    monkeypatch.setattr(calendar, "list_events", list_events)
+    return listed
+
+
+def test_search_events_falls_back_per_failed_calendar(monkeypatch):
+    """A calendar rejecting text-match is filtered locally; others keep server results."""
+    good = _Calendar("https://cal/good/", [_event("g1", "Team lunch")])
+    bad = _Calendar("https://cal/bad/", ValueError("text-match not supported"))
+    listed = _patch(monkeypatch, [good, bad], {
+        "https://cal/bad/": [_event("b1", "Lunch with Ann"), _event("b2", "Dentist")],
+    })
+
+    events = asyncio.run(calendar.search_events(None, "lunch"))
+
+    assert listed == ["https://cal/bad/"]
+    assert sorted(event["url"] for event in events) == ["b1", "g1"]
+
+
+def test_search_events_non_ascii_query_filters_locally(monkeypatch):
+    """Non-ASCII queries skip i;ascii-casemap text-match and match case-insensitively."""
+    cal = _Calendar("https://cal/home/", [])
+    listed = _patch(monkeypatch, [cal], {
+        "https://cal/home/": [_event("e1", "Über-Meeting"), _event("e2", "Standup")],
+    })
+
+    events = asyncio.run(calendar.search_events(None, "über"))
+
+    assert cal.searched == 0
+    assert listed == ["https://cal/home/"]
+    assert [event["url"] for event in events] == ["e1"]
@@ -0,0 +1,68 @@
+"""Tests for the contacts module's addressbook discovery."""
+
+import asyncio
+
+import pytest
+import requests
+
+from icloud_mcp import contacts
+
+STALE_URL = "https://contacts.example.com/123/carddavhome/old/"
+CURRENT_URL = "https://contacts.example.com/123/carddavhome/card/"
+
+VCARD = "BEGIN:VCARD\r\nVERSION:3.0\r\nFN:Ann Lee\r\nEMAIL:ann@x.com\r\nEND:VCARD\r\n"
+
+
+def _response(url, status, body=""):
+    response = requests.Response()
+    response.url = url
+    response.status_code = status
+    response._content = body.encode()
+    return response
+
+
+class _Session:
+    """CardDAV session stand-in: the stale addressbook URL is gone (404)."""
+
+    def __init__(self):
+        self.requests = []
+
+    def request(self, method, url, data=None, headers=None):
+        self.requests.append((method, url))
+        if url == STALE_URL:
+            return _response(url, 404)
+        if method == "PROPFIND":
+            return _response(url, 207, (
+                '<d:multistatus xmlns:d="DAV:" xmlns:cs="http://calendarserver.org/ns/">'
+                '<d:response><d:propstat><d:prop><cs:getctag>1</cs:getctag></d:prop>'
+                '</d:propstat></d:response></d:multistatus>'
+            ))
+        return _response(url, 207, (
+            '<d:multistatus xmlns:d="DAV:" xmlns:card="urn:ietf:params:xml:ns:carddav">'
+            '<d:response><d:href>ann.vcf</d:href><d:propstat><d:prop>'
+            f'<d:getetag>"1"</d:getetag><card:address-data>{VCARD}</card:address-data>'
+            '</d:prop></d:propstat></d:response></d:multistatus>'
+        ))
+
+
+def test_stale_addressbook_url_is_rediscovered(monkeypatch):
+    """A 404 from the cached addressbook fails the call and forces rediscovery."""
+    session = _Session()
+    monkeypatch.setattr(contacts, "require_auth", lambda: ("me@icloud.com", "pw"))
+    monkeypatch.setattr(contacts, "_get_carddav_session", lambda email, password: (session, email))
+    monkeypatch.setattr(contacts, "_discover_principal", lambda session, base_url: "principal")
+    monkeypatch.setattr(contacts, "_discover_addressbook_home", lambda session, principal_url: "home")
+    monkeypatch.setattr(
+        contacts, "_list_addressbooks",
+        lambda session, home_url: [{"url": CURRENT_URL, "name": "Card"}]
+    )
+    monkeypatch.setitem(contacts._ADDRESSBOOK_URLS, "me@icloud.com", (contacts.time.monotonic(), STALE_URL))
+
+    with pytest.raises(ValueError):
+        asyncio.run(contacts.list_contacts(None))
+    assert "me@icloud.com" not in contacts._ADDRESSBOOK_URLS
+
+    result = asyncio.run(contacts.list_contacts(None))
+
+    assert [contact["name"] for contact in result] == ["Ann Lee"]
+    assert contacts._ADDRESSBOOK_URLS["me@icloud.com"][1] == CURRENT_URL
@@ -0,0 +1,42 @@
+"""Tests for the email module's IMAP response handling."""
+
+from imapclient.response_parser import parse_fetch_response
+
+from icloud_mcp.email import _envelope_summary
+
+
+def _fetch_item(envelope: bytes) -> dict:
+    """Parse a FLAGS + ENVELOPE FETCH response line for UID 7."""
+    line = b'1 (UID 7 FLAGS (\\Seen) ENVELOPE ' + envelope + b')'
+    return parse_fetch_response([line], normalise_times=False, uid_is_key=True)[7]
+
+
+def test_envelope_summary_group_syntax():
+    """Group addresses ("undisclosed-recipients:;") don't drop the message."""
+    data = _fetch_item(
+        b'("Tue, 14 Oct 2025 09:30:00 -0700" "Hi" '
+        b'(("Ann" NIL "ann" "x.com")) NIL NIL '
+        b'((NIL NIL "undisclosed-recipients" NIL)(NIL NIL NIL NIL)) '
+        b'NIL NIL NIL "<m@x.com>")'
+    )
+
+    summary = _envelope_summary(7, data, "INBOX")
+
+    assert summary is not None
+    assert summary["from"] == "Ann <ann@x.com>"
+    assert summary["to"] == "undisclosed-recipients:;"
+
+
+def test_envelope_summary_group_with_members():
+    """Group members are listed inside the group."""
+    data = _fetch_item(
+        b'("Tue, 14 Oct 2025 09:30:00 -0700" "Hi" '
+        b'(("Ann" NIL "ann" "x.com")) NIL NIL '
+        b'((NIL NIL "team" NIL)(NIL NIL "bob" "y.com")(NIL NIL "cy" "z.com")(NIL NIL NIL NIL)'
+        b'("Dee" NIL "dee" "w.com")) '
+        b'NIL NIL NIL "<m@x.com>")'
+    )
+
+    summary = _envelope_summary(7, data, "INBOX")
+
+    assert summary["to"] == "team: bob@y.com, cy@z.com;, Dee <dee@w.com>"